@@ -0,0 +1,158 @@
+from collections.abc import Callable, Iterable, Iterator
+
+from dgol.cells import Direction, GolCells
+
+Coordinates = tuple[int, int]
+
+# Side of the square blocks of cells whose changes are tracked.
+BLOCK_SIZE = 8
+
+
+class ActiveGolCells(GolCells):
+    """Variant of `GolCells` computing only the blocks of cells which may change.
+
+    A cell can only change if a cell of its neighborhood has changed in the last generation, so only the blocks
+    around the blocks having changed cells are active. The outermost cells along a neighboring border are computed
+    only if the border has changed since the last generation. Stable and empty regions are not computed at all.
+    """
+
+    def __init__(self, cells: list[list[int]]):
+        self._cells = [row[:] for row in cells]
+
+        rows, columns = self.shape
+        self._blocks = -(-rows // BLOCK_SIZE), -(-columns // BLOCK_SIZE)
+        self._active = {(row, column) for row in range(self._blocks[0]) for column in range(self._blocks[1])}
+        self._borders: dict[Direction, list[int]] | None = None
+        self._is_still = False
+
+    @property
+    def as_serializable(self) -> list[list[int]]:
+        return self._cells
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self._cells), len(self._cells[0]) if self._cells else 0
+
+    def rows(self, start: int, stop: int) -> list[list[int]]:
+        return self._cells[start:stop]
+
+    @property
+    def is_still(self) -> bool:
+        return self._is_still
+
+    def iterate(self, neighboring_borders: dict[Direction, list[int]] | None = None) -> None:
+        self.iterate_rim(self.iterate_interior(), neighboring_borders)
+
+    def iterate_interior(self) -> dict[Coordinates, int]:
+        """The changed cells of the active blocks not bordering the neighbors."""
+
+        rows, columns = self.shape
+        inside = (
+            (row, column) for row, column in self._cells_of_active_blocks()
+            if 0 < row < rows - 1 and 0 < column < columns - 1
+        )
+
+        return self._changes(inside, lambda row, column: self._cells[row][column])
+
+    def iterate_rim(
+        self, interior: dict[Coordinates, int], neighboring_borders: dict[Direction, list[int]] | None = None
+    ) -> None:
+        borders = neighboring_borders or {}
+        rows, columns = self.shape
+
+        rim = {
+            (row, column) for row, column in self._cells_of_active_blocks()
+            if row in (0, rows - 1) or column in (0, columns - 1)
+        }
+
+        for direction in Direction:
+            if self._borders is None or borders.get(direction) != self._borders.get(direction):
+                rim.update(self._rim_along(direction))
+
+        def cell(row: int, column: int) -> int:
+            if 0 <= row < rows and 0 <= column < columns:
+                return self._cells[row][column]
+
+            return self._border_cell(borders, row, column)
+
+        changes = interior | self._changes(rim, cell)
+        cells = list(self._cells)
+
+        for row in {row for row, _ in changes}:
+            cells[row] = cells[row][:]
+
+        for (row, column), state in changes.items():
+            cells[row][column] = state
+
+        self._cells = cells
+        self._borders = dict(borders)
+        self._is_still = not changes
+        self._activate_around({(row // BLOCK_SIZE, column // BLOCK_SIZE) for row, column in changes})
+
+    def border_at(self, direction: Direction) -> list[int]:
+        return [self._cells[row][column] for row, column in self._rim_along(direction)]
+
+    def _cells_of_active_blocks(self) -> Iterator[Coordinates]:
+        rows, columns = self.shape
+
+        for block_row, block_column in self._active:
+            for row in range(block_row * BLOCK_SIZE, min((block_row + 1) * BLOCK_SIZE, rows)):
+                for column in range(block_column * BLOCK_SIZE, min((block_column + 1) * BLOCK_SIZE, columns)):
+                    yield row, column
+
+    @staticmethod
+    def _changes(cells: Iterable[Coordinates], cell: Callable[[int, int], int]) -> dict[Coordinates, int]:
+        changes = {}
+
+        for row, column in cells:
+            neighbors = sum(
+                cell(_row, _column)
+                for _row in range(row - 1, row + 2)
+                for _column in range(column - 1, column + 2) if _column != column or _row != row
+            )
+            state = cell(row, column)
+
+            if (next_state := 0 if neighbors < 2 or neighbors > 3 else 1 if neighbors == 3 else state) != state:
+                changes[(row, column)] = next_state
+
+        return changes
+
+    def _activate_around(self, changed_blocks: set[Coordinates]) -> None:
+        block_rows, block_columns = self._blocks
+
+        self._active = {
+            (block_row, block_column)
+            for changed_row, changed_column in changed_blocks
+            for block_row in range(max(changed_row - 1, 0), min(changed_row + 2, block_rows))
+            for block_column in range(max(changed_column - 1, 0), min(changed_column + 2, block_columns))
+        }
+
+    def _rim_along(self, direction: Direction) -> Iterator[Coordinates]:
+        """The outermost cells next to the border of the neighbor in the direction."""
+
+        rows, columns = self.shape
+
+        match direction:
+            case Direction.UP: return ((0, column) for column in range(columns))
+            case Direction.UPRIGHT: return iter([(0, columns - 1)])
+            case Direction.RIGHT: return ((row, columns - 1) for row in range(rows))
+            case Direction.DOWNRIGHT: return iter([(rows - 1, columns - 1)])
+            case Direction.DOWN: return ((rows - 1, column) for column in range(columns))
+            case Direction.DOWNLEFT: return iter([(rows - 1, 0)])
+            case Direction.LEFT: return ((row, 0) for row in range(rows))
+            case Direction.UPLEFT: return iter([(0, 0)])
+
+    def _border_cell(self, borders: dict[Direction, list[int]], row: int, column: int) -> int:
+        """Cell of a neighboring border, by its coordinates just outside of the tile."""
+
+        rows, columns = self.shape
+        vertical = Direction.UP if row < 0 else Direction.DOWN if row >= rows else None
+        horizontal = Direction.LEFT if column < 0 else Direction.RIGHT if column >= columns else None
+
+        match vertical, horizontal:
+            case None, None: raise IndexError(f"Cell {row}, {column} is inside the tile")
+            case _, None: direction, index = vertical, column
+            case None, _: direction, index = horizontal, row
+            case _: direction, index = Direction[f"{vertical.name}{horizontal.name}"], 0
+
+        return border[index] if (border := borders.get(direction)) else 0
@@ -0,0 +1,66 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar, Self, cast
+
+import numpy as np
+
+from dgol.cells import Direction
+from dgol.numpy_cells import NumpyGolCells
+
+# Bands thinner than this are not worth a thread of their own.
+MIN_BAND_ROWS = 64
+
+_executor: tuple[int, ThreadPoolExecutor] | None = None
+
+
+def _band_executor() -> ThreadPoolExecutor:
+    """Threads of the current process, the threads of a forked parent process are not inherited."""
+
+    global _executor
+
+    if _executor is None or _executor[0] != os.getpid():
+        _executor = os.getpid(), ThreadPoolExecutor(os.cpu_count(), thread_name_prefix="band")
+
+    return _executor[1]
+
+
+class BandedNumpyGolCells(NumpyGolCells):
+    """Variant of `NumpyGolCells` computing horizontal bands of a big tile in parallel threads.
+
+    Each band of the next generation is computed from the same rows of the padded tile and the halo rows
+    above and below them, into its rows of one shared output array. NumPy releases the GIL while computing
+    on the arrays, so the bands are computed on as many cores.
+    """
+
+    bands: ClassVar[int] = os.cpu_count() or 1
+
+    @classmethod
+    def with_bands(cls, bands: int) -> type[Self]:
+        """The engine splitting the tiles into at most `bands` bands instead of one per CPU core."""
+
+        return cast(type[Self], type(cls.__name__, (cls,), {"bands": bands}))
+
+    def iterate(self, neighboring_borders: dict[Direction, list[int]] | None = None) -> None:
+        self._cells = self._next_generation_in_bands(
+            self._extended_with_neighboring_border_cells(neighboring_borders or {})
+        )
+
+    def iterate_interior(self) -> np.ndarray:
+        return self._next_generation_in_bands(self._cells)
+
+    def _next_generation_in_bands(self, cells: np.ndarray) -> np.ndarray:
+        rows = cells.shape[0] - 2
+        bands = min(self.bands, rows // MIN_BAND_ROWS)
+
+        if bands < 2:
+            return self._next_generation_inside(cells)
+
+        next_cells = np.empty((rows, cells.shape[1] - 2), dtype=np.uint8)
+        bounds = [rows * band // bands for band in range(bands + 1)]
+
+        def compute_band(start: int, stop: int) -> None:
+            next_cells[start:stop] = self._next_generation_inside(cells[start:stop + 2])
+
+        list(_band_executor().map(compute_band, bounds[:-1], bounds[1:]))
+
+        return next_cells
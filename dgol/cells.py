@@ -1,5 +1,28 @@
+from collections.abc import Hashable, Iterator
 from enum import Enum, auto
-from typing import Self, cast
+from itertools import chain
+from typing import Any, Self, cast
+
+# Alive cells, whatever their value, are packed to bit 1.
+_BINARY_DIGITS = bytes.maketrans(bytes(range(256)), b"0" + b"1" * 255)
+# The cells packed to each byte, first cell in the most significant bit.
+_BYTE_CELLS = [[byte >> bit & 1 for bit in reversed(range(8))] for byte in range(256)]
+
+
+def pack_row(row: list[int]) -> bytes:
+    """The cells packed to one bit per cell and padded to whole bytes, first cell in the most significant bit,
+    like `numpy.packbits`."""
+
+    row_bytes = (len(row) + 7) // 8
+    digits = bytes(row).translate(_BINARY_DIGITS).ljust(row_bytes * 8, b"0")
+
+    return int(digits or b"0", base=2).to_bytes(row_bytes, "big")
+
+
+def unpack_row(packed: bytes, columns: int) -> list[int]:
+    """The first `columns` cells packed by `pack_row`."""
+
+    return list(chain.from_iterable(map(_BYTE_CELLS.__getitem__, packed)))[:columns]
 
 
 class Direction(Enum):
@@ -24,62 +47,231 @@ class Direction(Enum):
 
 
 class GolCells:
+    """Cells of a tile kept in two buffers padded by a halo of one cell, which the neighboring borders are copied into.
+
+    A generation is written from the front buffer into the back buffer, then the buffers are swapped,
+    so iterating does not allocate the cells again.
+    """
+
     def __init__(self, cells: list[list[int]]):
-        self._cells = cells
+        rows, columns = len(cells), len(cells[0]) if cells else 0
+        self._shape = rows, columns
+        self._front = [[0] * (columns + 2) for _ in range(rows + 2)]
+        self._back = [[0] * (columns + 2) for _ in range(rows + 2)]
+
+        for padded_row, cell_row in zip(self._front[1:], cells):
+            padded_row[1:-1] = cell_row
 
     @property
     def as_serializable(self) -> list[list[int]]:
-        return self._cells
+        return self.rows(0, self._shape[0])
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self._shape
+
+    def rows(self, start: int, stop: int) -> list[list[int]]:
+        """A band of the serializable cells."""
+
+        return [self._front[row][1:-1] for row in range(start + 1, min(stop, self._shape[0]) + 1)]
+
+    def snapshot(self) -> Hashable:
+        """Immutable copy of the cells, equal for equal cells, which `restore` recreates the cells from.
+
+        The rows are packed to one bit per cell, as many snapshots are kept, see `GolTile`.
+        """
+
+        cells = self.as_serializable
+        columns = len(cells[0]) if cells else 0
+
+        return columns, tuple(map(pack_row, cells))
+
+    @classmethod
+    def restore(cls, snapshot: Hashable) -> Self:
+        columns, rows = cast(tuple[int, tuple[bytes, ...]], snapshot)
+
+        return cls([unpack_row(row, columns) for row in rows])
+
+    @classmethod
+    def snapshot_rows(cls, snapshot: Hashable, start: int, stop: int) -> list[list[int]]:
+        """A band of the serializable cells of a snapshot, read without restoring all the cells."""
+
+        columns, rows = cast(tuple[int, tuple[bytes, ...]], snapshot)
+
+        return [unpack_row(row, columns) for row in rows[start:stop]]
+
+    @property
+    def is_still(self) -> bool:
+        """Whether the last generation left the cells unchanged, never for the engines not tracking their changes."""
+
+        return False
 
     def iterate(self, neighboring_borders: dict[Direction, list[int]] | None = None) -> None:
-        self._extend_with_neighboring_border_cells(neighboring_borders or {})
-
-        self._cells = [
-            [
-                0 if (neighbors := self._neighbors(row, column)) < 2 or neighbors > 3 else
-                1 if neighbors == 3 else cell
-                for column, cell in enumerate(cell_row[1:-1], start=1)
-            ]
-            for row, cell_row in enumerate(self._cells[1:-1], start=1)
+        self._copy_neighboring_borders(neighboring_borders or {})
+        rows, columns = self._shape
+
+        self._write_next_generation(range(1, rows + 1), range(1, columns + 1))
+        self._front, self._back = self._back, self._front
+
+    def iterate_interior(self) -> Any:
+        """Next generation of the cells not bordering the neighbors, computable before the borders are received.
+
+        The result completes the iteration when passed to `iterate_rim` along with the borders of the neighbors.
+        The interior is written into the back buffer, which is only read after the iteration.
+        """
+
+        rows, columns = self._shape
+        self._write_next_generation(range(2, rows), range(2, columns))
+
+    def iterate_rim(self, interior: Any, neighboring_borders: dict[Direction, list[int]] | None = None) -> None:
+        self._copy_neighboring_borders(neighboring_borders or {})
+        rows, columns = self._shape
+
+        self._write_next_generation(range(1, rows + 1), range(1, min(2, columns + 1)))
+        self._write_next_generation(range(1, rows + 1), range(max(2, columns), columns + 1))
+        self._write_next_generation(range(1, min(2, rows + 1)), range(2, columns))
+        self._write_next_generation(range(max(2, rows), rows + 1), range(2, columns))
+        self._front, self._back = self._back, self._front
+
+    def _write_next_generation(self, rows: range, columns: range) -> None:
+        """Writes the next generation of the cells in the rows and the columns of the padded buffers."""
+
+        front, back = self._front, self._back
+
+        for row in rows:
+            above, cell_row, below, next_row = front[row - 1], front[row], front[row + 1], back[row]
+
+            for column in columns:
+                neighbors = (
+                    above[column - 1] + above[column] + above[column + 1]
+                    + cell_row[column - 1] + cell_row[column + 1]
+                    + below[column - 1] + below[column] + below[column + 1]
+                )
+                next_row[column] = 1 if neighbors == 3 else cell_row[column] if neighbors == 2 else 0
+
+    def advance(self, generations: int) -> None:
+        """Iterates the given number of generations without neighbors."""
+
+        for _ in range(generations):
+            self.iterate()
+
+    def iterate_with_halos(self, neighboring_halos: dict[Direction, list[list[int]]], width: int) -> Iterator[Self]:
+        """Iterates `width` generations on the tile padded by the `width` deep halos of the neighbors.
+
+        The padded region shrinks by one cell on each side per generation, as its outermost cells cannot be computed.
+        The cells of the successive generations of the tile are yielded as new instances.
+        """
+
+        cells = self.as_serializable
+        rows, columns = len(cells), len(cells[0])
+
+        if width > min(rows, columns):
+            raise ValueError("Halo width exceeds the size of the cells")
+
+        padded = [[0] * (columns + 2 * width) for _ in range(rows + 2 * width)]
+
+        for row, cell_row in enumerate(cells, start=width):
+            padded[row][width:width + columns] = cell_row
+
+        for direction, halo in neighboring_halos.items():
+            row_range, column_range = self._halo_region(direction, rows, columns, width)
+
+            for row, halo_row in zip(row_range, halo):
+                padded[row][column_range.start:column_range.stop] = halo_row
+
+        absent_regions = [
+            self._halo_region(direction, rows, columns, width)
+            for direction in Direction if direction not in neighboring_halos
         ]
 
-    def _extend_with_neighboring_border_cells(self, neighboring_borders: dict[Direction, list[int]]) -> None:
-        left_border = neighboring_borders.get(Direction.LEFT, [0] * len(self._cells))
-        right_border = neighboring_borders.get(Direction.RIGHT, [0] * len(self._cells))
-        upper_border_row = (
-            neighboring_borders.get(Direction.UPLEFT, [0])
-            + neighboring_borders.get(Direction.UP, [0] * len(self._cells[0]))
-            + neighboring_borders.get(Direction.UPRIGHT, [0])
+        for generation in range(1, width + 1):
+            iterated = type(self)(padded)
+            iterated.iterate()
+            padded = [row[1:-1] for row in iterated.as_serializable[1:-1]]
+
+            for row_range, column_range in absent_regions:
+                start = max(column_range.start - generation, 0)
+                stop = min(column_range.stop - generation, len(padded[0]))
+
+                for row in range(max(row_range.start - generation, 0), min(row_range.stop - generation, len(padded))):
+                    padded[row][start:stop] = [0] * max(stop - start, 0)
+
+            offset = width - generation
+
+            yield type(self)([row[offset:offset + columns] for row in padded[offset:offset + rows]])
+
+    @staticmethod
+    def _halo_region(direction: Direction, rows: int, columns: int, width: int) -> tuple[range, range]:
+        """Location of the halo of a neighbor within the tile padded by `width` cells."""
+
+        above, vertically_inside, below = (
+            range(width), range(width, width + rows), range(width + rows, rows + 2 * width)
         )
-        down_border_row = (
-            neighboring_borders.get(Direction.DOWNLEFT, [0])
-            + neighboring_borders.get(Direction.DOWN, [0] * len(self._cells[0]))
-            + neighboring_borders.get(Direction.DOWNRIGHT, [0])
+        left, horizontally_inside, right = (
+            range(width), range(width, width + columns), range(width + columns, columns + 2 * width)
         )
 
-        for cell_row, left_border_cell, right_border_cell in zip(self._cells, left_border, right_border):
-            cell_row.insert(0, left_border_cell)
-            cell_row.append(right_border_cell)
+        match direction:
+            case Direction.UP: return above, horizontally_inside
+            case Direction.UPRIGHT: return above, right
+            case Direction.RIGHT: return vertically_inside, right
+            case Direction.DOWNRIGHT: return below, right
+            case Direction.DOWN: return below, horizontally_inside
+            case Direction.DOWNLEFT: return below, left
+            case Direction.LEFT: return vertically_inside, left
+            case Direction.UPLEFT: return above, left
+
+    def _copy_neighboring_borders(self, neighboring_borders: dict[Direction, list[int]]) -> None:
+        """Copies the borders into the halo of the front buffer, the halo is cleared where there is no neighbor."""
 
-        self._cells.insert(0, upper_border_row)
-        self._cells.append(down_border_row)
+        rows, columns = self._shape
+        front = self._front
+        top, bottom = front[0], front[rows + 1]
 
-    def _neighbors(self, row: int, column: int) -> int:
-        """Must only be called for the internal cells of the border extended cell matrix."""
+        for direction, row, column in [
+            (Direction.UPLEFT, 0, 0),
+            (Direction.UPRIGHT, 0, columns + 1),
+            (Direction.DOWNLEFT, rows + 1, 0),
+            (Direction.DOWNRIGHT, rows + 1, columns + 1),
+        ]:
+            front[row][column] = border[0] if (border := neighboring_borders.get(direction)) else 0
 
-        return sum(
-            self._cells[_row][_column]
-            for _row in range(row - 1, row + 2)
-            for _column in range(column - 1, column + 2) if _column != column or _row != row
-        )
+        for direction, halo_row in [(Direction.UP, top), (Direction.DOWN, bottom)]:
+            if (border := neighboring_borders.get(direction)) is not None:
+                halo_row[1:columns + 1] = border
+            else:
+                for column in range(1, columns + 1):
+                    halo_row[column] = 0
+
+        for direction, column in [(Direction.LEFT, 0), (Direction.RIGHT, columns + 1)]:
+            border = neighboring_borders.get(direction)
+
+            for row in range(1, rows + 1):
+                front[row][column] = border[row - 1] if border is not None else 0
 
     def border_at(self, direction: Direction) -> list[int]:
+        rows, columns = self._shape
+        front = self._front
+
+        match direction:
+            case Direction.UP: return front[1][1:columns + 1]
+            case Direction.UPRIGHT: return front[1][columns:columns + 1]
+            case Direction.RIGHT: return [front[row][columns] for row in range(1, rows + 1)]
+            case Direction.DOWNRIGHT: return front[rows][columns:columns + 1]
+            case Direction.DOWN: return front[rows][1:columns + 1]
+            case Direction.DOWNLEFT: return front[rows][1:2]
+            case Direction.LEFT: return [front[row][1] for row in range(1, rows + 1)]
+            case Direction.UPLEFT: return front[1][1:2]
+
+    def halo_at(self, direction: Direction, width: int) -> list[list[int]]:
+        """The `width` deep border cells needed by the neighbor in the given direction."""
+
+        cells = self.as_serializable
+        rows = cells[:width] if direction in (Direction.UPLEFT, Direction.UP, Direction.UPRIGHT) else (
+            cells[-width:] if direction in (Direction.DOWNLEFT, Direction.DOWN, Direction.DOWNRIGHT) else cells
+        )
+
         match direction:
-            case Direction.UP: return self._cells[0]
-            case Direction.UPRIGHT: return self._cells[0][-1:]
-            case Direction.RIGHT: return [row[-1] for row in self._cells]
-            case Direction.DOWNRIGHT: return self._cells[-1][-1:]
-            case Direction.DOWN: return self._cells[-1]
-            case Direction.DOWNLEFT: return self._cells[-1][:1]
-            case Direction.LEFT: return [row[0] for row in self._cells]
-            case Direction.UPLEFT: return self._cells[0][:1]
+            case Direction.UPLEFT | Direction.LEFT | Direction.DOWNLEFT: return [row[:width] for row in rows]
+            case Direction.UPRIGHT | Direction.RIGHT | Direction.DOWNRIGHT: return [row[-width:] for row in rows]
+            case _: return [row[:] for row in rows]
@@ -0,0 +1,56 @@
+import mmap
+import os
+import struct
+from pathlib import Path
+
+from dgol.cells import pack_row, unpack_row
+
+# Magic, iteration, rows and columns of the cells, followed by the rows packed to one bit per cell.
+HEADER = struct.Struct("<4sQII")
+MAGIC = b"DGOL"
+
+
+def write_checkpoint(path: str | Path, iteration: int, cells: list[list[int]]) -> None:
+    """Writes the iteration and the cells to a memory-mapped file, each row packed by `pack_row`.
+
+    The file is written next to the path and moved over it at once, so a crash never leaves a partial checkpoint.
+    """
+
+    rows, columns = len(cells), len(cells[0]) if cells else 0
+    row_bytes = (columns + 7) // 8
+    written = Path(f"{path}.tmp")
+
+    with open(written, "wb+") as file:
+        file.truncate(HEADER.size + rows * row_bytes)
+
+        with mmap.mmap(file.fileno(), 0) as mapped:
+            HEADER.pack_into(mapped, 0, MAGIC, iteration, rows, columns)
+
+            if row_bytes:
+                for row, cell_row in enumerate(cells):
+                    offset = HEADER.size + row * row_bytes
+                    mapped[offset:offset + row_bytes] = pack_row(cell_row)
+
+            mapped.flush()
+
+    os.replace(written, path)
+
+
+def read_checkpoint(path: str | Path) -> tuple[int, list[list[int]]]:
+    """The iteration and the cells written by `write_checkpoint`."""
+
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        magic, iteration, rows, columns = HEADER.unpack_from(mapped)
+
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a checkpoint")
+
+        row_bytes = (columns + 7) // 8
+
+        if not row_bytes:
+            return iteration, [[] for _ in range(rows)]
+
+        return iteration, [
+            unpack_row(mapped[offset:offset + row_bytes], columns)
+            for offset in range(HEADER.size, HEADER.size + rows * row_bytes, row_bytes)
+        ]
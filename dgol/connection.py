@@ -1,18 +1,52 @@
 import asyncio
 import json
+import struct
 from asyncio import StreamReader, StreamWriter
 from collections.abc import AsyncGenerator, Awaitable, Callable
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
+from enum import IntEnum
 from functools import wraps
 from typing import Any, Self
 
+from dgol.cells import Direction, pack_row, unpack_row
+from dgol.encoding import Encoding, decode, encode, runs
+from dgol.shared_borders import SharedBorders, SharedBordersReader
+
+
+class MessageKind(IntEnum):
+    JSON = 1
+    BORDER = 2  # Single row or column of cells.
+    HALO = 3
+    CELLS = 4
+
 
 class Connection:
-    DIGITS_OF_ENCODED_DATA_LENGTH = 4
+    """Exchanges framed messages, each having a header followed by a payload.
+
+    The header contains the kind of the message, the direction and the iteration of the border cells,
+    the encoding and the shape of the cells and the length of the payload.
+    Cells are sent packed to one bit per cell, row by row by `pack_row`, any other data is sent JSON encoded.
+    Borders and cells are also sent JSON encoded if `binary` is false, e.g. for debugging.
+
+    Packed cells are run-length encoded if they have few runs and grids are compressed if they are big.
+    Borders are sent as the XOR of the last border sent in the same direction on the connection
+    if that has fewer runs, or as an empty payload if they are unchanged.
+    The receiver decodes all the encodings, so the sender chooses them on its own.
+
+    Borders can be published in shared memory for a receiver on the same host,
+    then only their location is sent on the connection.
+    """
+
+    HEADER = struct.Struct("!BBBQIIQ")
+    binary = True
+    encoded = True
 
     def __init__(self, reader: StreamReader, writer: StreamWriter):
         self.reader = reader
         self.writer = writer
+        self._sent_borders: dict[tuple[MessageKind, Direction], tuple[int, int]] = {}
+        self._received_borders: dict[tuple[MessageKind, int], int] = {}
+        self._shared_borders_reader = SharedBordersReader()
 
     async def __aenter__(self) -> Self:
         return self
@@ -43,28 +77,155 @@ class Connection:
     @classmethod
     @asynccontextmanager
     async def connect(cls, host: str, port: int) -> AsyncGenerator[Self]:
+        async with await cls.open(host, port) as connection:
+            yield connection
+
+    @classmethod
+    async def open(cls, host: str, port: int) -> Self:
+        """Opens a long-lived connection, which has to be closed by `aclose`."""
+
         reader, writer = await asyncio.open_connection(host, port)
 
-        async with cls(reader, writer) as connection:
-            yield connection
+        return cls(reader, writer)
+
+    @property
+    def is_closed(self) -> bool:
+        """Either this end or the other end has closed the connection."""
+
+        return self.writer.is_closing() or self.reader.at_eof()
 
     async def aclose(self) -> None:
+        self._shared_borders_reader.close()
         self.writer.close()
-        await self.writer.wait_closed()
 
-    async def send(self, data: Any) -> None:
-        serialized_obj = json.dumps(data).encode()
-        serialized_len = f"{len(serialized_obj):0{self.DIGITS_OF_ENCODED_DATA_LENGTH}x}".encode()
-
-        if len(serialized_len) != self.DIGITS_OF_ENCODED_DATA_LENGTH:
-            raise ValueError("Object to send has invalid length")
+        with suppress(ConnectionError):  # The other end may have already closed the connection.
+            await self.writer.wait_closed()
 
-        self.writer.write(serialized_len)
-        self.writer.write(serialized_obj)
+    async def send(self, data: Any) -> None:
+        await self._send_frame(MessageKind.JSON, json.dumps(data).encode())
+
+    async def send_border(
+        self, direction: Direction, iteration: int, border: Any, shared_borders: SharedBorders | None = None
+    ) -> None:
+        """Border cells are received as a dictionary of the direction, the iteration and the border.
+
+        The border is published in `shared_borders` if it is given and the border fits in it.
+        """
+
+        if not self._is_binary(border):
+            await self.send({"direction": direction.name, "iteration": iteration, "border": border})
+        elif border and isinstance(border[0], list):
+            await self._send_cells_frame(MessageKind.HALO, border, direction, iteration, shared_borders)
+        else:
+            await self._send_cells_frame(MessageKind.BORDER, [border], direction, iteration, shared_borders)
+
+    async def send_cells(self, cells: list[list[int]]) -> None:
+        if self._is_binary(cells):
+            await self._send_cells_frame(MessageKind.CELLS, cells)
+        else:
+            await self.send(cells)
+
+    def _is_binary(self, cells: Any) -> bool:
+        if not self.binary or not isinstance(cells, list):
+            return False
+
+        rows = cells if cells and isinstance(cells[0], list) else [cells]
+
+        return all(isinstance(row, list) and set(row) <= {0, 1} for row in rows)
+
+    async def _send_cells_frame(
+        self,
+        kind: MessageKind,
+        cells: list[list[int]],
+        direction: Direction | None = None,
+        iteration: int = 0,
+        shared_borders: SharedBorders | None = None,
+    ) -> None:
+        rows, columns = len(cells), len(cells[0]) if cells else 0
+        packed = b"".join(map(pack_row, cells))
+
+        if not self.encoded:
+            await self._send_frame(kind, packed, rows, columns, direction, iteration)
+
+            return
+
+        # The encodings work on the packed rows as one integer, the bytes of an unencoded payload stay as they are.
+        length, bits = len(packed) * 8, int.from_bytes(packed, "little")
+        encoding, data = Encoding(0), bits
+
+        if direction is not None:
+            last_bits, last_length = self._sent_borders.get((kind, direction), (0, -1))
+            self._sent_borders[(kind, direction)] = bits, length
+
+            if last_length == length and bits == last_bits:
+                await self._send_frame(kind, b"", rows, columns, direction, iteration, Encoding.UNCHANGED)
+
+                return
+
+            if last_length == length and runs(delta := bits ^ last_bits, length) < runs(bits, length):
+                encoding, data = Encoding.DELTA, delta
+
+        data_encoding, payload = encode(data, length, compress=kind != MessageKind.BORDER)
+        encoding |= data_encoding
+
+        if shared_borders and direction and (location := shared_borders.write(direction, iteration, payload)):
+            encoding, payload = encoding | Encoding.SHARED, location
+
+        await self._send_frame(kind, payload, rows, columns, direction, iteration, encoding)
+
+    async def _send_frame(
+        self,
+        kind: MessageKind,
+        payload: bytes,
+        rows: int = 0,
+        columns: int = 0,
+        direction: Direction | None = None,
+        iteration: int = 0,
+        encoding: Encoding = Encoding(0),
+    ) -> None:
+        header = self.HEADER.pack(
+            kind, direction.value if direction else 0, encoding, iteration, rows, columns, len(payload)
+        )
+        self.writer.writelines([header, memoryview(payload)])
 
         await self.writer.drain()
 
     async def recv(self) -> Any:
-        serialized_len = int((await self.reader.readexactly(self.DIGITS_OF_ENCODED_DATA_LENGTH)), base=16)
-
-        return json.loads(await self.reader.readexactly(serialized_len))
+        kind, direction, encoding, iteration, rows, columns, length = self.HEADER.unpack(
+            await self.reader.readexactly(self.HEADER.size)
+        )
+        payload = await self.reader.readexactly(length)
+
+        if kind == MessageKind.JSON:
+            return json.loads(payload)
+
+        row_bytes = (columns + 7) // 8
+        packed_length = rows * row_bytes
+
+        if Encoding.UNCHANGED in Encoding(encoding):
+            bits = self._received_borders[(kind, direction)]
+        elif Encoding.SHARED in Encoding(encoding):
+            with self._shared_borders_reader.read(payload) as shared_payload:
+                bits = decode(Encoding(encoding), shared_payload, packed_length * 8)
+        elif not encoding and not direction:
+            bits = None  # The payload is the packed rows, there is no border to remember it by.
+        else:
+            bits = decode(Encoding(encoding), payload, packed_length * 8)
+
+        if direction:
+            if Encoding.DELTA in Encoding(encoding):
+                bits ^= self._received_borders[(kind, direction)]
+
+            self._received_borders[(kind, direction)] = bits
+
+        packed = payload if bits is None else bits.to_bytes(packed_length, "little")
+        cells = [unpack_row(packed[row * row_bytes:(row + 1) * row_bytes], columns) for row in range(rows)]
+
+        if kind == MessageKind.CELLS:
+            return cells
+
+        return {
+            "direction": Direction(direction).name,
+            "iteration": iteration,
+            "border": cells[0] if kind == MessageKind.BORDER else cells,
+        }
@@ -0,0 +1,110 @@
+import zlib
+from collections.abc import Iterator
+from enum import IntFlag
+
+# Run-length encoding pays off when the runs are rare compared to the bytes of the packed cells.
+RUN_LENGTH_BYTES_PER_RUN = 4
+COMPRESSION_THRESHOLD = 512
+
+
+class Encoding(IntFlag):
+    """Encoding of bit-packed cells, the cells are sent packed to one bit per cell if no flag is set."""
+
+    DELTA = 1  # XOR of the cells and the last cells sent in the same direction.
+    RUN_LENGTH = 2
+    ZLIB = 4
+    SHARED = 8  # The payload is the location of the encoded cells in shared memory.
+    UNCHANGED = 16  # The cells are the last cells sent in the same direction, the payload is empty.
+
+
+def runs(bits: int, length: int) -> int:
+    """Number of runs of equal cells, starting with a run of dead cells which may be empty."""
+
+    return _transitions(bits, length).bit_count() + 1
+
+
+def _transitions(bits: int, length: int) -> int:
+    return (bits ^ bits << 1) & ((1 << length) - 1)
+
+
+def encode(bits: int, length: int, compress: bool = False) -> tuple[Encoding, bytes]:
+    """The encoding is chosen by the number of runs of the cells, dense grids are compressed if `compress` is set."""
+
+    packed_length = (length + 7) // 8
+
+    if runs(bits, length) * RUN_LENGTH_BYTES_PER_RUN < packed_length:
+        return Encoding.RUN_LENGTH, run_length_encode(bits, length)
+
+    packed = bits.to_bytes(packed_length, "little")
+
+    if compress and packed_length >= COMPRESSION_THRESHOLD:
+        if len(compressed := zlib.compress(packed, 1)) < packed_length:
+            return Encoding.ZLIB, compressed
+
+    return Encoding(0), packed
+
+
+def decode(encoding: Encoding, payload: bytes | memoryview, length: int) -> int:
+    if Encoding.RUN_LENGTH in encoding:
+        return run_length_decode(payload, length)
+
+    if Encoding.ZLIB in encoding:
+        payload = zlib.decompress(payload)
+
+    return int.from_bytes(payload, "little")
+
+
+def run_length_encode(bits: int, length: int) -> bytes:
+    """The lengths of the alternating runs of dead and alive cells as unsigned LEB128 integers."""
+
+    encoded = bytearray()
+    transitions = _transitions(bits, length)
+    start = 0
+
+    while transitions:
+        lowest = transitions & -transitions
+        transitions ^= lowest
+        position = lowest.bit_length() - 1
+        _append_varint(encoded, position - start)
+        start = position
+
+    _append_varint(encoded, length - start)
+
+    return bytes(encoded)
+
+
+def run_length_decode(payload: bytes | memoryview, length: int) -> int:
+    bits = position = 0
+    alive = False
+
+    for run in _varints(payload):
+        if alive:
+            bits |= ((1 << run) - 1) << position
+
+        position += run
+        alive = not alive
+
+    if position != length:
+        raise ValueError("Run lengths do not add up to the number of cells")
+
+    return bits
+
+
+def _append_varint(encoded: bytearray, value: int) -> None:
+    while value >= 0x80:
+        encoded.append(value & 0x7F | 0x80)
+        value >>= 7
+
+    encoded.append(value)
+
+
+def _varints(payload: bytes | memoryview) -> Iterator[int]:
+    value = shift = 0
+
+    for byte in payload:
+        value |= (byte & 0x7F) << shift
+        shift += 7
+
+        if not byte & 0x80:
+            yield value
+            value = shift = 0
@@ -0,0 +1,243 @@
+from itertools import islice
+
+from dgol.cells import Direction, GolCells
+
+# The tile is surrounded by wall cells which never change and count as dead neighbors,
+# so the tile evolves as if it had no neighbors while the rule stays independent of the position.
+DEAD, ALIVE, WALL = 0, 1, 2
+
+Leaf = int
+
+
+class Node:
+    __slots__ = ("nw", "ne", "sw", "se", "level", "population")
+
+    def __init__(self, nw: "Node | Leaf", ne: "Node | Leaf", sw: "Node | Leaf", se: "Node | Leaf"):
+        self.nw, self.ne, self.sw, self.se = nw, ne, sw, se
+        self.level = nw.level + 1 if isinstance(nw, Node) else 1
+        self.population = sum(
+            child.population if isinstance(child, Node) else child == ALIVE for child in (nw, ne, sw, se)
+        )
+
+
+class HashLifeGolCells(GolCells):
+    """Variant of `GolCells` based on the HashLife algorithm to advance a standalone tile by many generations at once.
+
+    The tile is stored in a quadtree whose nodes are canonicalized, so identical regions are shared
+    and their future is computed once. Both the canonical node table and the memoized futures
+    are bounded by `cache_size` entries, the oldest entries are evicted first.
+    """
+
+    def __init__(self, cells: list[list[int]], cache_size: int = 1 << 20):
+        self._cache_size = cache_size
+        self._nodes: dict[tuple[Node | Leaf, ...], Node] = {}
+        self._futures: dict[tuple[Node, int], Node] = {}
+        self._walls: list[Node | Leaf] = [WALL]
+
+        self._rows = len(cells)
+        self._columns = len(cells[0]) if cells else 0
+        self._level = max(1, (max(self._rows, self._columns) - 1).bit_length())
+        self._origin = 0
+        self._root = self._build(cells, 0, 0, self._level)
+
+    def _join(self, nw: Node | Leaf, ne: Node | Leaf, sw: Node | Leaf, se: Node | Leaf) -> Node:
+        key = (nw, ne, sw, se)
+
+        if (node := self._nodes.get(key)) is None:
+            self._evict(self._nodes)
+            node = self._nodes[key] = Node(nw, ne, sw, se)
+
+        return node
+
+    def _evict(self, cache: dict) -> None:
+        if len(cache) >= self._cache_size:
+            for key in list(islice(cache, len(cache) // 2 or 1)):
+                del cache[key]
+
+    def _wall(self, level: int) -> Node | Leaf:
+        while len(self._walls) <= level:
+            wall = self._walls[-1]
+            self._walls.append(self._join(wall, wall, wall, wall))
+
+        return self._walls[level]
+
+    def _build(self, cells: list[list[int]], row: int, column: int, level: int) -> Node | Leaf:
+        if row >= self._rows or column >= self._columns:
+            return self._wall(level)
+
+        if level == 0:
+            return ALIVE if cells[row][column] else DEAD
+
+        half = 1 << (level - 1)
+
+        return self._join(
+            self._build(cells, row, column, level - 1),
+            self._build(cells, row, column + half, level - 1),
+            self._build(cells, row + half, column, level - 1),
+            self._build(cells, row + half, column + half, level - 1),
+        )
+
+    @property
+    def as_serializable(self) -> list[list[int]]:
+        return self.rows(0, self._rows)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self._rows, self._columns
+
+    def rows(self, start: int, stop: int) -> list[list[int]]:
+        cells = [[0] * self._columns for _ in range(start, min(stop, self._rows))]
+        self._fill(cells, self._root, -self._origin - start, -self._origin)
+
+        return cells
+
+    def _fill(self, cells: list[list[int]], node: Node | Leaf, row: int, column: int) -> None:
+        """Only the alive cells of the node overlapping with the rows of the cells are filled in."""
+
+        if not isinstance(node, Node):
+            if node == ALIVE and 0 <= row < len(cells):
+                cells[row][column] = 1
+
+            return
+
+        half = 1 << (node.level - 1)
+
+        if not node.population or row >= len(cells) or row + 2 * half <= 0:
+            return
+
+        for child, child_row, child_column in (
+            (node.nw, row, column),
+            (node.ne, row, column + half),
+            (node.sw, row + half, column),
+            (node.se, row + half, column + half),
+        ):
+            self._fill(cells, child, child_row, child_column)
+
+    def iterate(self, neighboring_borders: dict[Direction, list[int]] | None = None) -> None:
+        if not neighboring_borders:
+            self.advance(1)
+
+            return
+
+        # The neighboring borders are valid for a single generation only, which cannot be expressed in the quadtree.
+        cells = GolCells(self.as_serializable)
+        cells.iterate(neighboring_borders)
+        self._origin = 0
+        self._root = self._build(cells.as_serializable, 0, 0, self._level)
+
+    def iterate_interior(self) -> GolCells:
+        """The dense cells holding the next generation of the interior, completed by `iterate_rim`."""
+
+        cells = GolCells(self.as_serializable)
+        cells.iterate_interior()
+
+        return cells
+
+    def iterate_rim(self, interior: GolCells, neighboring_borders: dict[Direction, list[int]] | None = None) -> None:
+        interior.iterate_rim(None, neighboring_borders)
+        self._origin = 0
+        self._root = self._build(interior.as_serializable, 0, 0, self._level)
+
+    def advance(self, generations: int) -> None:
+        for step in range(generations.bit_length()):
+            if generations >> step & 1:
+                self._advance_by_power_of_two(step)
+
+    def _advance_by_power_of_two(self, step: int) -> None:
+        """The root is extended by walls until the tile is in the center half which the future is computed for."""
+
+        while not (
+            self._root.level >= step + 2
+            and self._origin >= (quarter := 1 << (self._root.level - 2))
+            and self._origin + max(self._rows, self._columns) <= 3 * quarter
+        ):
+            self._extend_root()
+
+        self._root = self._future(self._root, step)
+        self._origin -= 1 << (self._root.level - 1)
+
+    def _extend_root(self) -> None:
+        root = self._root
+        wall = self._wall(root.level - 1)
+
+        self._root = self._join(
+            self._join(wall, wall, wall, root.nw),
+            self._join(wall, wall, root.ne, wall),
+            self._join(wall, root.sw, wall, wall),
+            self._join(root.se, wall, wall, wall),
+        )
+        self._origin += 1 << (root.level - 1)
+
+    def _future(self, node: Node, step: int) -> Node:
+        """Center half of the node after `2 ** step` generations."""
+
+        if not node.population:
+            return self._center(node)
+
+        if (future := self._futures.get((node, step))) is not None:
+            return future
+
+        if node.level == 2:
+            future = self._next_generation_of_4x4(node)
+        else:
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            parts = [
+                nw, self._horizontal_center(nw, ne), ne,
+                self._vertical_center(nw, sw), self._center(node), self._vertical_center(ne, se),
+                sw, self._horizontal_center(sw, se), se,
+            ]
+
+            if step == node.level - 2:
+                parts = [self._future(part, step - 1) for part in parts]
+                remaining_step = step - 1
+            else:
+                parts = [self._center(part) for part in parts]
+                remaining_step = step
+
+            future = self._join(
+                self._future(self._join(parts[0], parts[1], parts[3], parts[4]), remaining_step),
+                self._future(self._join(parts[1], parts[2], parts[4], parts[5]), remaining_step),
+                self._future(self._join(parts[3], parts[4], parts[6], parts[7]), remaining_step),
+                self._future(self._join(parts[4], parts[5], parts[7], parts[8]), remaining_step),
+            )
+
+        self._evict(self._futures)
+        self._futures[(node, step)] = future
+
+        return future
+
+    def _center(self, node: Node) -> Node:
+        return self._join(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+
+    def _horizontal_center(self, west: Node, east: Node) -> Node:
+        return self._join(west.ne, east.nw, west.se, east.sw)
+
+    def _vertical_center(self, north: Node, south: Node) -> Node:
+        return self._join(north.sw, north.se, south.nw, south.ne)
+
+    def _next_generation_of_4x4(self, node: Node) -> Node:
+        cells = [
+            [node.nw.nw, node.nw.ne, node.ne.nw, node.ne.ne],
+            [node.nw.sw, node.nw.se, node.ne.sw, node.ne.se],
+            [node.sw.nw, node.sw.ne, node.se.nw, node.se.ne],
+            [node.sw.sw, node.sw.se, node.se.sw, node.se.se],
+        ]
+
+        def next_state(row: int, column: int) -> Leaf:
+            cell = cells[row][column]
+
+            if cell == WALL:
+                return WALL
+
+            neighbors = sum(
+                cells[_row][_column] == ALIVE
+                for _row in range(row - 1, row + 2)
+                for _column in range(column - 1, column + 2) if _column != column or _row != row
+            )
+
+            return DEAD if neighbors < 2 or neighbors > 3 else ALIVE if neighbors == 3 else cell
+
+        return self._join(next_state(1, 1), next_state(1, 2), next_state(2, 1), next_state(2, 2))
+
+    def border_at(self, direction: Direction) -> list[int]:
+        return GolCells(self.as_serializable).border_at(direction)
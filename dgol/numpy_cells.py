@@ -0,0 +1,119 @@
+from typing import Self
+
+import numpy as np
+
+from dgol.cells import Direction, GolCells
+
+
+class NumpyGolCells(GolCells):
+    """Vectorized variant of `GolCells` computing the neighbor counts by summing shifted views of the padded tile."""
+
+    def __init__(self, cells: list[list[int]]):
+        self._cells = np.array(cells, dtype=np.uint8)
+
+    @property
+    def as_serializable(self) -> list[list[int]]:
+        return self._cells.tolist()
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self._cells.shape
+
+    def rows(self, start: int, stop: int) -> list[list[int]]:
+        return self._cells[start:stop].tolist()
+
+    def snapshot(self) -> tuple[tuple[int, ...], bytes]:
+        return self._cells.shape, np.packbits(self._cells).tobytes()
+
+    @classmethod
+    def restore(cls, snapshot: tuple[tuple[int, ...], bytes]) -> Self:
+        shape, data = snapshot
+        cells = cls.__new__(cls)
+        cells._cells = np.unpackbits(np.frombuffer(data, dtype=np.uint8), count=shape[0] * shape[1]).reshape(shape)
+
+        return cells
+
+    @classmethod
+    def snapshot_rows(cls, snapshot: tuple[tuple[int, ...], bytes], start: int, stop: int) -> list[list[int]]:
+        """The rows are not aligned to bytes, only the bytes holding the band are unpacked."""
+
+        (rows, columns), data = snapshot
+        stop = min(stop, rows)
+
+        if start >= stop:
+            return []
+
+        first_bit, stop_bit = start * columns, stop * columns
+        bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8)[first_bit // 8:(stop_bit + 7) // 8])
+        offset = first_bit % 8
+
+        return bits[offset:offset + stop_bit - first_bit].reshape(stop - start, columns).tolist()
+
+    def iterate(self, neighboring_borders: dict[Direction, list[int]] | None = None) -> None:
+        self._cells = self._next_generation_inside(
+            self._extended_with_neighboring_border_cells(neighboring_borders or {})
+        )
+
+    def iterate_interior(self) -> np.ndarray:
+        return self._next_generation_inside(self._cells)
+
+    def iterate_rim(self, interior: np.ndarray, neighboring_borders: dict[Direction, list[int]] | None = None) -> None:
+        """Only the outermost rows and columns are computed from the tile padded by the neighboring borders."""
+
+        padded = self._extended_with_neighboring_border_cells(neighboring_borders or {})
+        cells = np.empty_like(self._cells)
+        cells[1:-1, 1:-1] = interior
+        cells[:1] = self._next_generation_inside(padded[:3])
+        cells[-1:] = self._next_generation_inside(padded[-3:])
+        cells[:, :1] = self._next_generation_inside(padded[:, :3])
+        cells[:, -1:] = self._next_generation_inside(padded[:, -3:])
+
+        self._cells = cells
+
+    @staticmethod
+    def _next_generation_inside(cells: np.ndarray) -> np.ndarray:
+        """Next generation of the cells except the outermost ones, which do not have all their neighbors."""
+
+        rows, columns = cells.shape[0] - 2, cells.shape[1] - 2
+
+        neighbors = sum(
+            cells[row_offset:row_offset + rows, column_offset:column_offset + columns]
+            for row_offset in range(3)
+            for column_offset in range(3) if row_offset != 1 or column_offset != 1
+        )
+
+        return np.where(neighbors == 3, 1, np.where(neighbors == 2, cells[1:-1, 1:-1], 0)).astype(np.uint8)
+
+    def _extended_with_neighboring_border_cells(self, neighboring_borders: dict[Direction, list[int]]) -> np.ndarray:
+        padded = np.zeros((self._cells.shape[0] + 2, self._cells.shape[1] + 2), dtype=np.uint8)
+        padded[1:-1, 1:-1] = self._cells
+
+        for direction, border in neighboring_borders.items():
+            padded[self._border_slice(direction)] = border
+
+        return padded
+
+    @staticmethod
+    def _border_slice(direction: Direction) -> tuple[slice | int, slice | int]:
+        """Location of the border cells of a neighbor within the padded tile."""
+
+        match direction:
+            case Direction.UP: return 0, slice(1, -1)
+            case Direction.UPRIGHT: return 0, slice(-1, None)
+            case Direction.RIGHT: return slice(1, -1), -1
+            case Direction.DOWNRIGHT: return -1, slice(-1, None)
+            case Direction.DOWN: return -1, slice(1, -1)
+            case Direction.DOWNLEFT: return -1, slice(None, 1)
+            case Direction.LEFT: return slice(1, -1), 0
+            case Direction.UPLEFT: return 0, slice(None, 1)
+
+    def border_at(self, direction: Direction) -> list[int]:
+        match direction:
+            case Direction.UP: return self._cells[0].tolist()
+            case Direction.UPRIGHT: return self._cells[0, -1:].tolist()
+            case Direction.RIGHT: return self._cells[:, -1].tolist()
+            case Direction.DOWNRIGHT: return self._cells[-1, -1:].tolist()
+            case Direction.DOWN: return self._cells[-1].tolist()
+            case Direction.DOWNLEFT: return self._cells[-1, :1].tolist()
+            case Direction.LEFT: return self._cells[:, 0].tolist()
+            case Direction.UPLEFT: return self._cells[0, :1].tolist()
@@ -0,0 +1,156 @@
+from typing import Self
+
+from dgol.cells import Direction, GolCells
+
+
+def pack(cells: list[int]) -> int:
+    """The cell at index `i` is stored in bit `i`."""
+
+    return int("".join(map(str, reversed(cells))) or "0", base=2)
+
+
+def unpack(packed: int, length: int) -> list[int]:
+    return list(map(int, reversed(f"{packed:0{length}b}"))) if length else []
+
+
+class PackedGolCells(GolCells):
+    """Bit-packed variant of `GolCells` storing each row as a Python integer with one bit per cell.
+
+    A generation is computed on whole rows at once by adding the shifted neighbor rows with bitwise adders.
+    The borders can be retrieved packed by `packed_border_at` and `iterate` accepts packed borders as well.
+    """
+
+    def __init__(self, cells: list[list[int]]):
+        self._width = len(cells[0]) if cells else 0
+        self._rows = [pack(row) for row in cells]
+
+    @property
+    def as_serializable(self) -> list[list[int]]:
+        return [unpack(row, self._width) for row in self._rows]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self._rows), self._width
+
+    def rows(self, start: int, stop: int) -> list[list[int]]:
+        return [unpack(row, self._width) for row in self._rows[start:stop]]
+
+    def snapshot(self) -> tuple[int, tuple[int, ...]]:
+        return self._width, tuple(self._rows)
+
+    @classmethod
+    def restore(cls, snapshot: tuple[int, tuple[int, ...]]) -> Self:
+        cells = cls.__new__(cls)
+        cells._width, rows = snapshot
+        cells._rows = list(rows)
+
+        return cells
+
+    @classmethod
+    def snapshot_rows(cls, snapshot: tuple[int, tuple[int, ...]], start: int, stop: int) -> list[list[int]]:
+        width, rows = snapshot
+
+        return [unpack(row, width) for row in rows[start:stop]]
+
+    def iterate(self, neighboring_borders: dict[Direction, list[int] | int] | None = None) -> None:
+        borders = {direction: self._as_packed(border) for direction, border in (neighboring_borders or {}).items()}
+        rows = self._extended_with_neighboring_border_cells(borders)
+        mask = ((1 << self._width) - 1) << 1
+
+        self._rows = [
+            (self._next_row(above, row, below) & mask) >> 1
+            for above, row, below in zip(rows, rows[1:], rows[2:])
+        ]
+
+    def iterate_interior(self) -> list[int]:
+        interior_mask = ((1 << self._width) - 1) & ~1 & ~(1 << (self._width - 1)) if self._width else 0
+
+        return [
+            self._next_row(above, row, below) & interior_mask
+            for above, row, below in zip(self._rows, self._rows[1:], self._rows[2:])
+        ]
+
+    def iterate_rim(
+        self, interior: list[int], neighboring_borders: dict[Direction, list[int] | int] | None = None
+    ) -> None:
+        """The first and the last row are computed whole, the other rows only at their first and last cell
+        from three cell wide windows of the rows extended by the neighboring borders.
+        """
+
+        borders = {direction: self._as_packed(border) for direction, border in (neighboring_borders or {}).items()}
+        rows = self._extended_with_neighboring_border_cells(borders)
+        mask = ((1 << self._width) - 1) << 1
+        right_shift = self._width - 1
+
+        def rim_of_row(above: int, row: int, below: int) -> int:
+            left = self._next_row(above & 7, row & 7, below & 7) >> 1 & 1
+            right = self._next_row(above >> right_shift & 7, row >> right_shift & 7, below >> right_shift & 7) >> 1 & 1
+
+            return left | right << right_shift
+
+        self._rows = [
+            (self._next_row(*rows[index:index + 3]) & mask) >> 1 if index in (0, len(self._rows) - 1) else
+            interior[index - 1] | rim_of_row(*rows[index:index + 3])
+            for index in range(len(self._rows))
+        ]
+
+    @staticmethod
+    def _as_packed(border: list[int] | int) -> int:
+        return border if isinstance(border, int) else pack(border)
+
+    def _extended_with_neighboring_border_cells(self, borders: dict[Direction, int]) -> list[int]:
+        """The rows are shifted by one bit to make room for the left border cell."""
+
+        left_border = borders.get(Direction.LEFT, 0)
+        right_border = borders.get(Direction.RIGHT, 0)
+        right_shift = self._width + 1
+
+        def extended(left: int, row: int, right: int) -> int:
+            return left | row << 1 | right << right_shift
+
+        return [
+            extended(borders.get(Direction.UPLEFT, 0), borders.get(Direction.UP, 0), borders.get(Direction.UPRIGHT, 0)),
+            *(
+                extended(left_border >> index & 1, row, right_border >> index & 1)
+                for index, row in enumerate(self._rows)
+            ),
+            extended(
+                borders.get(Direction.DOWNLEFT, 0), borders.get(Direction.DOWN, 0), borders.get(Direction.DOWNRIGHT, 0)
+            ),
+        ]
+
+    @staticmethod
+    def _next_row(above: int, row: int, below: int) -> int:
+        """Counts the 8 neighbors of every cell in bit-sliced binary counters (ones, twos, fours or more)."""
+
+        ones = twos = fours = 0
+
+        for neighbors in (above << 1, above, above >> 1, row << 1, row >> 1, below << 1, below, below >> 1):
+            twos_carry = ones & neighbors
+            ones ^= neighbors
+            fours |= twos & twos_carry
+            twos ^= twos_carry
+
+        return twos & ~fours & (ones | row)
+
+    def packed_border_at(self, direction: Direction) -> int:
+        match direction:
+            case Direction.UP: return self._rows[0]
+            case Direction.UPRIGHT: return self._rows[0] >> (self._width - 1) & 1
+            case Direction.RIGHT: return self._packed_column(self._width - 1)
+            case Direction.DOWNRIGHT: return self._rows[-1] >> (self._width - 1) & 1
+            case Direction.DOWN: return self._rows[-1]
+            case Direction.DOWNLEFT: return self._rows[-1] & 1
+            case Direction.LEFT: return self._packed_column(0)
+            case Direction.UPLEFT: return self._rows[0] & 1
+
+    def _packed_column(self, column: int) -> int:
+        return sum((row >> column & 1) << index for index, row in enumerate(self._rows))
+
+    def border_at(self, direction: Direction) -> list[int]:
+        match direction:
+            case Direction.UP | Direction.DOWN: length = self._width
+            case Direction.RIGHT | Direction.LEFT: length = len(self._rows)
+            case _: length = 1
+
+        return unpack(self.packed_border_at(direction), length)
@@ -0,0 +1,56 @@
+import re
+from pathlib import Path
+
+RUN_LENGTH_ITEM = re.compile(r"(\d*)([^\d\s])")
+
+
+def read_pattern(path: str | Path) -> list[list[int]]:
+    """Reads a pattern in the run length encoded format (.rle) or in the plaintext format (any other extension)."""
+
+    text = Path(path).read_text()
+
+    return parse_run_length_encoded(text) if Path(path).suffix.lower() == ".rle" else parse_plaintext(text)
+
+
+def parse_plaintext(text: str) -> list[list[int]]:
+    """Lines starting with `!` are comments, `.` is a dead cell and any other character is an alive cell."""
+
+    rows = [[int(cell != ".") for cell in line.rstrip()] for line in text.splitlines() if not line.startswith("!")]
+
+    return _padded(rows)
+
+
+def format_plaintext(rows: list[list[int]]) -> str:
+    """Lines of `.` for dead and `O` for alive cells, which `parse_plaintext` reads back."""
+
+    return "".join("".join(".O"[cell] for cell in row) + "\n" for row in rows)
+
+
+def parse_run_length_encoded(text: str) -> list[list[int]]:
+    """Lines starting with `#` are comments, the header line with the size of the pattern is optional."""
+
+    lines = [line for line in text.splitlines() if not line.startswith("#")]
+    width = height = 0
+
+    if lines and lines[0].lstrip().startswith("x"):
+        header = dict(item.split("=") for item in lines.pop(0).replace(" ", "").split(",") if "=" in item)
+        width, height = int(header.get("x", 0)), int(header.get("y", 0))
+
+    rows: list[list[int]] = [[]]
+
+    for count, tag in RUN_LENGTH_ITEM.findall("".join(lines)):
+        run = int(count or 1)
+
+        match tag:
+            case "!": break
+            case "$": rows.extend([] for _ in range(run))
+            case "b" | ".": rows[-1].extend([0] * run)
+            case _: rows[-1].extend([1] * run)
+
+    return _padded(rows[:height] + [[]] * (height - len(rows)) if height else rows, width)
+
+
+def _padded(rows: list[list[int]], width: int = 0) -> list[list[int]]:
+    width = max([width, *map(len, rows)])
+
+    return [row + [0] * (width - len(row)) for row in rows]
@@ -0,0 +1,60 @@
+import struct
+from multiprocessing.shared_memory import SharedMemory
+
+from dgol.cells import Direction
+
+# Offset and length of the border within the segment followed by the name of the segment.
+LOCATION = struct.Struct("!QQ")
+
+
+class SharedBorders:
+    """Segment of shared memory the encoded borders of a process are published in for its neighbors on the same host.
+
+    Each direction has two slots used by the border exchanges alternately, so a neighbor can still read
+    the border of the previous exchange while the border of the next one is written.
+    """
+
+    def __init__(self, slot_size: int, generations_per_exchange: int = 1):
+        self.slot_size = slot_size
+        self.generations_per_exchange = generations_per_exchange
+        self._memory = SharedMemory(create=True, size=max(1, 2 * len(Direction) * slot_size))
+
+    def write(self, direction: Direction, iteration: int, payload: bytes) -> bytes | None:
+        """Returns the location of the written border or None if the border does not fit in a slot."""
+
+        if len(payload) > self.slot_size:
+            return None
+
+        parity = iteration // self.generations_per_exchange % 2
+        offset = ((direction.value - 1) * 2 + parity) * self.slot_size
+        self._memory.buf[offset:offset + len(payload)] = payload
+
+        return LOCATION.pack(offset, len(payload)) + self._memory.name.encode()
+
+    def close(self) -> None:
+        self._memory.close()
+        self._memory.unlink()
+
+
+class SharedBordersReader:
+    """Reads the borders published by the neighbors, the segments are attached at their first border."""
+
+    def __init__(self):
+        self._memories: dict[str, SharedMemory] = {}
+
+    def read(self, location: bytes) -> memoryview:
+        """The border is not copied, the returned view has to be released before closing the reader."""
+
+        offset, length = LOCATION.unpack_from(location)
+        name = location[LOCATION.size:].decode()
+
+        if (memory := self._memories.get(name)) is None:
+            memory = self._memories[name] = SharedMemory(name)
+
+        return memory.buf[offset:offset + length]
+
+    def close(self) -> None:
+        for memory in self._memories.values():
+            memory.close()
+
+        self._memories = {}
@@ -0,0 +1,169 @@
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from typing import Self
+
+from dgol.cells import Direction, GolCells
+
+Coordinates = tuple[int, int]
+
+
+class SparseGolCells(GolCells):
+    """Variant of `GolCells` storing only the coordinates of the alive cells.
+
+    Neighbors are counted only around the alive cells, so the cost of an iteration scales with the population
+    instead of the area of the tile.
+    """
+
+    def __init__(self, cells: list[list[int]]):
+        self._rows = len(cells)
+        self._columns = len(cells[0]) if cells else 0
+        self._alive = {
+            (row, column): cell
+            for row, cell_row in enumerate(cells)
+            for column, cell in enumerate(cell_row) if cell
+        }
+
+    @property
+    def population(self) -> int:
+        return len(self._alive)
+
+    @property
+    def as_serializable(self) -> list[list[int]]:
+        return self.rows(0, self._rows)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self._rows, self._columns
+
+    def rows(self, start: int, stop: int) -> list[list[int]]:
+        stop = min(stop, self._rows)
+        cells = [[0] * self._columns for _ in range(start, stop)]
+
+        for (row, column), cell in self._alive.items():
+            if start <= row < stop:
+                cells[row - start][column] = cell
+
+        return cells
+
+    def snapshot(self) -> tuple[int, int, bytes]:
+        """The sorted indices of the alive cells packed to 4 or 8 bytes each, alive cells are restored as 1."""
+
+        return self._rows, self._columns, array(
+            self._index_type(self._rows, self._columns),
+            sorted(row * self._columns + column for row, column in self._alive),
+        ).tobytes()
+
+    @classmethod
+    def restore(cls, snapshot: tuple[int, int, bytes]) -> Self:
+        cells = cls.__new__(cls)
+        cells._rows, cells._columns, indices = snapshot
+        cells._alive = {
+            divmod(index, cells._columns): 1 for index in array(cls._index_type(cells._rows, cells._columns), indices)
+        }
+
+        return cells
+
+    @classmethod
+    def snapshot_rows(cls, snapshot: tuple[int, int, bytes], start: int, stop: int) -> list[list[int]]:
+        """The indices are sorted, so only the alive cells of the band are looked at."""
+
+        rows, columns, indices = snapshot
+        cells = [[0] * columns for _ in range(start, min(stop, rows))]
+        alive = array(cls._index_type(rows, columns), indices)
+
+        for index in alive[bisect_left(alive, start * columns):bisect_left(alive, min(stop, rows) * columns)]:
+            row, column = divmod(index, columns)
+            cells[row - start][column] = 1
+
+        return cells
+
+    @staticmethod
+    def _index_type(rows: int, columns: int) -> str:
+        return "I" if rows * columns <= 2**32 else "Q"
+
+    def iterate(self, neighboring_borders: dict[Direction, list[int]] | None = None) -> None:
+        self._alive = self._next_generation(
+            [*self._alive.items(), *self._alive_border_cells(neighboring_borders or {})]
+        )
+
+    def iterate_interior(self) -> dict[Coordinates, int]:
+        return self._next_generation(
+            self._alive.items(), lambda row, column: 0 < row < self._rows - 1 and 0 < column < self._columns - 1
+        )
+
+    def iterate_rim(
+        self, interior: dict[Coordinates, int], neighboring_borders: dict[Direction, list[int]] | None = None
+    ) -> None:
+        """Only the alive cells close to the rim and the neighboring borders are counted as neighbors."""
+
+        def is_on_rim(row: int, column: int) -> bool:
+            return row in (0, self._rows - 1) or column in (0, self._columns - 1)
+
+        def is_close_to_rim(row: int, column: int) -> bool:
+            return row < 2 or row >= self._rows - 2 or column < 2 or column >= self._columns - 2
+
+        cells_close_to_rim = [
+            (coordinates, cell) for coordinates, cell in self._alive.items() if is_close_to_rim(*coordinates)
+        ]
+
+        self._alive = interior | self._next_generation(
+            [*cells_close_to_rim, *self._alive_border_cells(neighboring_borders or {})], is_on_rim
+        )
+
+    def _next_generation(
+        self, cells: Iterable[tuple[Coordinates, int]], is_computed: Callable[[int, int], bool] | None = None
+    ) -> dict[Coordinates, int]:
+        """Alive cells of the next generation among the neighbors of the given cells, which are to be computed."""
+
+        neighbors: Counter[Coordinates] = Counter()
+
+        for (row, column), cell in cells:
+            for neighbor in self._neighbors_inside(row, column):
+                if is_computed is None or is_computed(*neighbor):
+                    neighbors[neighbor] += cell
+
+        return {
+            coordinates: 1 if count == 3 else self._alive[coordinates]
+            for coordinates, count in neighbors.items()
+            if count == 3 or count == 2 and coordinates in self._alive
+        }
+
+    def _alive_border_cells(self, neighboring_borders: dict[Direction, list[int]]) -> Iterator[tuple[Coordinates, int]]:
+        for direction, border in neighboring_borders.items():
+            for coordinates, cell in zip(self._border_coordinates(direction), border):
+                if cell:
+                    yield coordinates, cell
+
+    def _border_coordinates(self, direction: Direction) -> Iterator[Coordinates]:
+        """Coordinates of the border cells of a neighbor, relative to this tile."""
+
+        match direction:
+            case Direction.UP: return ((-1, column) for column in range(self._columns))
+            case Direction.UPRIGHT: return iter([(-1, self._columns)])
+            case Direction.RIGHT: return ((row, self._columns) for row in range(self._rows))
+            case Direction.DOWNRIGHT: return iter([(self._rows, self._columns)])
+            case Direction.DOWN: return ((self._rows, column) for column in range(self._columns))
+            case Direction.DOWNLEFT: return iter([(self._rows, -1)])
+            case Direction.LEFT: return ((row, -1) for row in range(self._rows))
+            case Direction.UPLEFT: return iter([(-1, -1)])
+
+    def _neighbors_inside(self, row: int, column: int) -> Iterator[Coordinates]:
+        for _row in range(max(row - 1, 0), min(row + 2, self._rows)):
+            for _column in range(max(column - 1, 0), min(column + 2, self._columns)):
+                if _column != column or _row != row:
+                    yield _row, _column
+
+    def border_at(self, direction: Direction) -> list[int]:
+        match direction:
+            case Direction.UP: coordinates = ((0, column) for column in range(self._columns))
+            case Direction.UPRIGHT: coordinates = iter([(0, self._columns - 1)])
+            case Direction.RIGHT: coordinates = ((row, self._columns - 1) for row in range(self._rows))
+            case Direction.DOWNRIGHT: coordinates = iter([(self._rows - 1, self._columns - 1)])
+            case Direction.DOWN: coordinates = ((self._rows - 1, column) for column in range(self._columns))
+            case Direction.DOWNLEFT: coordinates = iter([(self._rows - 1, 0)])
+            case Direction.LEFT: coordinates = ((row, 0) for row in range(self._rows))
+            case Direction.UPLEFT: coordinates = iter([(0, 0)])
+
+        return [self._alive.get(cell, 0) for cell in coordinates]
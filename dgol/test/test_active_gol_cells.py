@@ -0,0 +1,34 @@
+from dgol.active_cells import BLOCK_SIZE, ActiveGolCells
+from dgol.cells import Direction, GolCells
+from dgol.test import test_gol_cells
+
+
+class TestActiveGolCells(test_gol_cells.TestGolCells):
+    gol_cells_type = ActiveGolCells
+
+    def test_only_blocks_around_the_changes_are_computed(self):
+        size = 4 * BLOCK_SIZE
+        cells = [[0] * size for _ in range(size)]
+        cells[1][1:3] = cells[2][1:3] = [1, 1]  # Block, a still life.
+        cells[2 * BLOCK_SIZE + 4][2 * BLOCK_SIZE + 3:2 * BLOCK_SIZE + 6] = [1, 1, 1]  # Blinker.
+        active_cells, expected_cells = ActiveGolCells([row.copy() for row in cells]), GolCells(cells)
+
+        active_cells.iterate()
+        expected_cells.iterate()
+
+        self.assertEqual(active_cells.as_serializable, expected_cells.as_serializable)
+        self.assertEqual(active_cells._active, {(row, column) for row in (1, 2, 3) for column in (1, 2, 3)})
+        self.assertFalse(active_cells.is_still)
+
+    def test_cells_are_still_when_nothing_changes(self):
+        block = [[0, 0, 0, 0], [0, 1, 1, 0], [0, 1, 1, 0], [0, 0, 0, 0]]
+        cells, expected_cells = ActiveGolCells([row.copy() for row in block]), GolCells(block)
+        cells.iterate()
+
+        self.assertTrue(cells.is_still)
+
+        cells.iterate({Direction.UP: [1, 1, 1, 0]})
+        expected_cells.iterate({Direction.UP: [1, 1, 1, 0]})
+
+        self.assertFalse(cells.is_still)
+        self.assertEqual(cells.as_serializable, expected_cells.as_serializable)
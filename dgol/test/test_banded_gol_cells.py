@@ -0,0 +1,33 @@
+import random
+from importlib.util import find_spec
+from unittest import skipUnless
+
+from dgol.cells import Direction
+from dgol.test import test_gol_cells
+
+
+@skipUnless(find_spec("numpy"), "NumPy is not installed")
+class TestBandedNumpyGolCells(test_gol_cells.TestGolCells):
+    def setUp(self):
+        from dgol.banded_cells import BandedNumpyGolCells
+
+        self.gol_cells_type = BandedNumpyGolCells.with_bands(3)
+
+    def test_big_tiles_are_iterated_in_bands(self):
+        from dgol.banded_cells import MIN_BAND_ROWS
+        from dgol.numpy_cells import NumpyGolCells
+
+        random.seed(0)
+        cells = [[random.randint(0, 1) for _ in range(50)] for _ in range(3 * MIN_BAND_ROWS + 1)]
+        neighboring_borders = {Direction.UP: [1] * 50, Direction.LEFT: [1] * len(cells), Direction.DOWNRIGHT: [1]}
+        banded_cells, expected_cells = self.gol_cells_type(cells), NumpyGolCells(cells)
+
+        for _ in range(3):
+            banded_cells.iterate(neighboring_borders)
+            expected_cells.iterate(neighboring_borders)
+
+        banded_cells.iterate_rim(banded_cells.iterate_interior(), neighboring_borders)
+        expected_cells.iterate_rim(expected_cells.iterate_interior(), neighboring_borders)
+
+        self.assertEqual(banded_cells.as_serializable, expected_cells.as_serializable)
+        self.assertIsInstance(self.gol_cells_type.restore(banded_cells.snapshot()), self.gol_cells_type)
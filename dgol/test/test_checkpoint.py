@@ -0,0 +1,40 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from dgol.checkpoint import HEADER, read_checkpoint, write_checkpoint
+
+
+class TestCheckpoint(TestCase):
+    def test_cells_and_iteration_can_be_read_back(self):
+        cells = [[0, 1, 0, 0, 1, 1, 0, 1, 1], [1, 1, 1, 0, 0, 0, 0, 0, 0], [0, 0, 0, 0, 0, 0, 0, 0, 1]]
+
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "tile.gol"
+            write_checkpoint(path, 42, cells)
+
+            self.assertEqual(read_checkpoint(path), (42, cells))
+            self.assertEqual(path.stat().st_size, HEADER.size + 3 * 2)
+            self.assertEqual(list(Path(directory).iterdir()), [path])
+
+    def test_rows_are_packed_to_whole_bytes_first_cell_in_the_most_significant_bit(self):
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "tile.gol"
+            write_checkpoint(path, 0, [[1, 0, 0, 0, 0, 0, 0, 1, 1], [0, 0, 0, 0, 0, 0, 0, 0, 1]])
+
+            self.assertEqual(path.read_bytes()[HEADER.size:], bytes([0b10000001, 0b10000000, 0, 0b10000000]))
+
+    def test_empty_cells_can_be_read_back(self):
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "tile.gol"
+            write_checkpoint(path, 7, [[]])
+
+            self.assertEqual(read_checkpoint(path), (7, [[]]))
+
+    def test_other_files_are_not_read_as_checkpoints(self):
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "tile.gol"
+            path.write_bytes(bytes(HEADER.size))
+
+            with self.assertRaises(ValueError):
+                read_checkpoint(path)
@@ -3,9 +3,12 @@ from asyncio import TaskGroup
 from contextlib import closing
 from socket import socketpair
 from unittest import IsolatedAsyncioTestCase
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
-from dgol.connection import Connection
+from dgol.cells import Direction
+from dgol.connection import Connection, MessageKind
+from dgol.encoding import Encoding
+from dgol.shared_borders import SharedBorders
 
 
 class TestConnection(IsolatedAsyncioTestCase):
@@ -26,15 +29,105 @@ class TestConnection(IsolatedAsyncioTestCase):
 
             self.assertEqual(receiver_task.result(), data)
 
-    async def test_error_when_sending_too_big_data(self):
+    async def test_big_data_can_be_sent(self):
+        await self.assert_sent_data_can_be_received(Connection.send, 'd' * 0x10000)
+
+    async def test_cells_can_be_sent(self):
+        for description, cells in [
+            ("binary", [[1, 0, 1, 1, 0, 0, 1, 0, 1], [0] * 9, [1] * 9]),
+            ("empty", [[]]),
+            ("not binary", [[1, 2], [3, 4]]),
+        ]:
+            with self.subTest(case=description):
+                await self.assert_sent_data_can_be_received(Connection.send_cells, cells)
+
+    async def test_borders_can_be_sent(self):
+        for description, border in [
+            ("border", [1, 0, 0, 1]),
+            ("halo", [[1, 0], [0, 1], [1, 1]]),
+            ("not binary", "border"),
+        ]:
+            with self.subTest(case=description):
+                await self.assert_sent_data_can_be_received(
+                    lambda connection, border: connection.send_border(Direction.DOWNLEFT, 12, border),
+                    border,
+                    expected={"direction": "DOWNLEFT", "iteration": 12, "border": border},
+                )
+
+    async def test_borders_can_be_sent_as_delta_of_the_last_border_sent_in_the_same_direction(self):
+        """An unchanged border is sent without payload."""
+
         sock_1, sock_2 = socketpair()
+        _reader, writer = await asyncio.open_connection(sock=sock_1)
+        reader, _writer = await asyncio.open_connection(sock=sock_2)
+
+        borders = [[0, 1] * 100, [0, 1] * 100, [1, 1] + [0, 1] * 99, [0] * 200]
+
+        with closing(writer), closing(_writer):
+            receiver = Connection(reader, _writer)
+            sender = Connection(_reader, writer)
+
+            for iteration, (border, encoding) in enumerate(
+                zip(borders, [Encoding(0), Encoding.UNCHANGED, Encoding.DELTA, Encoding(0)])
+            ):
+                with self.subTest(iteration=iteration), patch.object(
+                    sender, "_send_frame", wraps=sender._send_frame
+                ) as send_frame:
+                    await sender.send_border(Direction.UP, iteration, border)
+
+                    self.assertEqual((await receiver.recv())["border"], border)
+                    self.assertEqual(send_frame.await_args.args[-1] & (Encoding.DELTA | Encoding.UNCHANGED), encoding)
+
+    async def test_borders_can_be_sent_through_shared_memory(self):
+        shared_borders = SharedBorders(slot_size=16)
+        self.addCleanup(shared_borders.close)
+
+        for description, border, is_shared in [
+            ("border", [1, 0, 0, 1], True),
+            ("halo", [[1, 0], [0, 1], [1, 1]], True),
+            ("border not fitting", [0, 1] * 100, False),
+        ]:
+            with self.subTest(case=description), patch.object(
+                Connection, "_send_frame", autospec=True, side_effect=Connection._send_frame
+            ) as send_frame:
+                await self.assert_sent_data_can_be_received(
+                    lambda connection, border: connection.send_border(Direction.UP, 1, border, shared_borders),
+                    border,
+                    expected={"direction": "UP", "iteration": 1, "border": border},
+                )
+
+                self.assertEqual(Encoding.SHARED in send_frame.await_args.args[-1], is_shared)
+
+    async def test_big_cells_can_be_sent_compressed(self):
+        await self.assert_sent_data_can_be_received(Connection.send_cells, [[1, 1, 0] * 100] * 100)
+
+    async def test_cells_can_be_sent_unencoded(self):
+        with patch.object(Connection, "encoded", new=False):
+            await self.assert_sent_data_can_be_received(Connection.send_cells, [[0] * 100] * 100)
 
+    async def test_unencoded_cells_are_sent_packed_row_by_row(self):
+        with patch.object(Connection, "encoded", new=False), patch.object(Connection, "_send_frame") as send_frame:
+            await Connection(Mock(), Mock()).send_cells([[1, 0, 0, 0, 0, 0, 0, 0, 1], [0, 0, 0, 0, 0, 0, 0, 0, 1]])
+
+            self.assertEqual(send_frame.await_args.args[1], bytes([0b10000000, 0b10000000, 0, 0b10000000]))
+
+    async def test_cells_can_be_sent_json_encoded(self):
+        with patch.object(Connection, "binary", new=False), patch.object(Connection, "_send_frame") as send_frame:
+            await Connection(Mock(), Mock()).send_cells([[1, 0]])
+
+            self.assertEqual(send_frame.await_args.args[0], MessageKind.JSON)
+
+    async def assert_sent_data_can_be_received(self, send, data, expected=None):
+        sock_1, sock_2 = socketpair()
         _reader, writer = await asyncio.open_connection(sock=sock_1)
-        _, _writer = await asyncio.open_connection(sock=sock_2)
+        reader, _writer = await asyncio.open_connection(sock=sock_2)
 
         with closing(writer), closing(_writer):
-            with self.assertRaises(ValueError):
-                await Connection(_reader, writer).send('d' * 0x10000)
+            async with TaskGroup() as task_group:
+                receiver_task = task_group.create_task(Connection(reader, _writer).recv())
+                task_group.create_task(send(Connection(_reader, writer), data))
+
+            self.assertEqual(receiver_task.result(), data if expected is None else expected)
 
     async def test_can_communicate_with_a_server(self):
         class Server:
@@ -51,3 +144,22 @@ class TestConnection(IsolatedAsyncioTestCase):
             await connection.send(data)
 
             self.assertEqual(await connection.recv(), data)
+
+    async def test_long_lived_connection_can_detect_that_it_is_closed_by_the_other_end(self):
+        class Server:
+            async def close(self, connection):
+                await connection.recv()
+
+        host = "127.0.0.1"
+
+        async with await Connection.start_server(Server().close, host) as server:
+            connection = await Connection.open(host, Connection.port_of(server))
+
+            self.assertFalse(connection.is_closed)
+
+            await connection.send("data")
+            await asyncio.wait_for(connection.reader.read(), timeout=1)
+
+            self.assertTrue(connection.is_closed)
+
+            await connection.aclose()
@@ -0,0 +1,35 @@
+from unittest import TestCase
+
+from dgol.encoding import Encoding, decode, encode, runs
+from dgol.packed_cells import pack
+
+
+class TestEncoding(TestCase):
+    def test_runs_can_be_counted(self):
+        for cells, expected_runs in [
+            ([], 1),
+            ([0, 0, 0], 1),
+            ([1, 1, 1], 2),
+            ([0, 1, 1, 0, 1], 4),
+        ]:
+            with self.subTest(cells=cells):
+                self.assertEqual(runs(pack(cells), len(cells)), expected_runs)
+
+    def test_encoding_is_chosen_by_the_density_of_the_cells(self):
+        for description, cells, compress, expected_encoding in [
+            ("few runs", [0] * 1000 + [1] * 10 + [0] * 1000, False, Encoding.RUN_LENGTH),
+            ("many runs", [0, 1] * 100, False, Encoding(0)),
+            ("many runs compressed", [0, 1, 1] * 2000, True, Encoding.ZLIB),
+            ("too small to compress", [0, 1, 1] * 20, True, Encoding(0)),
+        ]:
+            with self.subTest(case=description):
+                encoding, payload = encode(pack(cells), len(cells), compress)
+
+                self.assertEqual(encoding, expected_encoding)
+                self.assertEqual(decode(encoding, payload, len(cells)), pack(cells))
+
+    def test_run_lengths_have_to_add_up_to_the_number_of_cells(self):
+        encoding, payload = encode(0, 1000)
+
+        with self.assertRaises(ValueError):
+            decode(encoding, payload, 999)
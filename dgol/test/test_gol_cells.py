@@ -4,6 +4,8 @@ from dgol.cells import Direction, GolCells
 
 
 class TestGolCells(TestCase):
+    gol_cells_type: type[GolCells] = GolCells
+
     def test_serializable_data_can_be_retrieved(self):
         cells = [
             [1, 2, 3],
@@ -11,10 +13,10 @@ class TestGolCells(TestCase):
             [7, 8, 9],
         ]
 
-        self.assertEqual(GolCells(cells).as_serializable, cells)
+        self.assertEqual(self.gol_cells_type(cells).as_serializable, cells)
 
     def test_cells_with_less_than_2_alive_neighbors_shall_die(self):
-        cells = GolCells(
+        cells = self.gol_cells_type(
             [
                 [1, 0, 0, 1],
                 [1, 0, 0, 0],
@@ -27,7 +29,7 @@ class TestGolCells(TestCase):
         self.assertEqual(cells.as_serializable, [[0] * 4] * 3)
 
     def test_alive_cells_with_2_or_3_alive_neighbors_shall_stay_alive(self):
-        cells = GolCells(
+        cells = self.gol_cells_type(
             [
                 [0, 1, 1],
                 [1, 0, 1],
@@ -47,7 +49,7 @@ class TestGolCells(TestCase):
         )
 
     def test_alive_cells_with_more_than_3_alive_neighbors_shall_die(self):
-        cells = GolCells(
+        cells = self.gol_cells_type(
             [
                 [1, 1, 1],
                 [1, 0, 1],
@@ -67,7 +69,7 @@ class TestGolCells(TestCase):
         )
 
     def test_dead_cells_with_3_alive_neighbors_shall_be_alive(self):
-        cells = GolCells(
+        cells = self.gol_cells_type(
             [
                 [0, 1, 0],
                 [1, 0, 1],
@@ -153,14 +155,59 @@ class TestGolCells(TestCase):
 
         for description, neighboring_borders, initial_cells, iterated_cells in cases:
             with self.subTest(case=description):
-                cells = GolCells(initial_cells)
+                cells = self.gol_cells_type(initial_cells)
 
                 cells.iterate(neighboring_borders=neighboring_borders)
 
                 self.assertEqual(cells.as_serializable, iterated_cells)
 
+    def test_interior_and_rim_can_be_iterated_separately(self):
+        cells = [
+            [1, 1, 0, 0, 1],
+            [0, 1, 1, 0, 0],
+            [1, 0, 1, 1, 0],
+            [0, 0, 1, 0, 1],
+        ]
+        neighboring_borders = {
+            Direction.UP: [1, 0, 1, 1, 0],
+            Direction.RIGHT: [1, 1, 0, 1],
+            Direction.DOWNLEFT: [1],
+        }
+        iterated_cells = self.gol_cells_type([row.copy() for row in cells])
+        iterated_cells.iterate({direction: border.copy() for direction, border in neighboring_borders.items()})
+
+        gol_cells = self.gol_cells_type(cells)
+        gol_cells.iterate_rim(gol_cells.iterate_interior(), neighboring_borders)
+
+        self.assertEqual(gol_cells.as_serializable, iterated_cells.as_serializable)
+
+    def test_borders_of_a_generation_do_not_affect_the_next_ones(self):
+        gol_cells = self.gol_cells_type([[0, 0, 0], [0, 0, 0], [0, 0, 0]])
+
+        gol_cells.iterate({Direction.UP: [1, 1, 1]})
+        self.assertEqual(gol_cells.as_serializable, [[0, 1, 0], [0, 0, 0], [0, 0, 0]])
+
+        gol_cells.iterate_rim(gol_cells.iterate_interior())
+        self.assertEqual(gol_cells.as_serializable, [[0, 0, 0], [0, 0, 0], [0, 0, 0]])
+
+    def test_cells_can_be_restored_from_snapshots(self):
+        cells = [
+            [0, 1, 0, 0],
+            [0, 0, 1, 0],
+            [1, 1, 1, 0],
+        ]
+        gol_cells = self.gol_cells_type([row.copy() for row in cells])
+        snapshot = gol_cells.snapshot()
+
+        self.assertEqual(snapshot, self.gol_cells_type([row.copy() for row in cells]).snapshot())
+
+        gol_cells.iterate()
+
+        self.assertNotEqual(gol_cells.snapshot(), snapshot)
+        self.assertEqual(self.gol_cells_type.restore(snapshot).as_serializable, cells)
+
     def test_border_cells_can_be_retrieved(self):
-        cells = GolCells(
+        cells = self.gol_cells_type(
             [
                 [1, 2, 3],
                 [4, 5, 6],
@@ -180,3 +227,87 @@ class TestGolCells(TestCase):
         }.items():
             with self.subTest(direction=direction):
                 self.assertEqual(cells.border_at(direction), border_cells)
+
+    def test_bands_of_rows_can_be_retrieved(self):
+        cells = self.gol_cells_type(
+            [
+                [1, 0, 0],
+                [0, 1, 0],
+                [0, 0, 1],
+                [1, 1, 0],
+            ]
+        )
+
+        self.assertEqual(cells.shape, (4, 3))
+        self.assertEqual(cells.rows(1, 3), [[0, 1, 0], [0, 0, 1]])
+        self.assertEqual(cells.rows(3, 5), [[1, 1, 0]])
+
+    def test_bands_of_rows_can_be_read_from_snapshots(self):
+        snapshot = self.gol_cells_type(
+            [
+                [1, 0, 0],
+                [0, 1, 0],
+                [0, 0, 1],
+                [1, 1, 0],
+            ]
+        ).snapshot()
+
+        self.assertEqual(self.gol_cells_type.snapshot_rows(snapshot, 1, 3), [[0, 1, 0], [0, 0, 1]])
+        self.assertEqual(self.gol_cells_type.snapshot_rows(snapshot, 3, 5), [[1, 1, 0]])
+        self.assertEqual(self.gol_cells_type.snapshot_rows(snapshot, 4, 5), [])
+
+    def test_halo_cells_can_be_retrieved(self):
+        cells = self.gol_cells_type(
+            [
+                [1, 1, 0],
+                [0, 0, 1],
+                [1, 0, 1],
+            ]
+        )
+
+        for direction, halo in {
+            Direction.UP: [[1, 1, 0], [0, 0, 1]],
+            Direction.UPRIGHT: [[1, 0], [0, 1]],
+            Direction.RIGHT: [[1, 0], [0, 1], [0, 1]],
+            Direction.DOWNRIGHT: [[0, 1], [0, 1]],
+            Direction.DOWN: [[0, 0, 1], [1, 0, 1]],
+            Direction.DOWNLEFT: [[0, 0], [1, 0]],
+            Direction.LEFT: [[1, 1], [0, 0], [1, 0]],
+            Direction.UPLEFT: [[1, 1], [0, 0]],
+        }.items():
+            with self.subTest(direction=direction):
+                self.assertEqual(cells.halo_at(direction, width=2), halo)
+
+    def test_generations_can_be_iterated_with_halos_of_neighbors(self):
+        cells = self.gol_cells_type(
+            [
+                [1, 0, 0],
+                [0, 0, 0],
+                [0, 0, 0],
+            ]
+        )
+        neighboring_halos = {
+            Direction.UP: [[0, 0, 0], [1, 0, 0]],
+            Direction.LEFT: [[1, 1], [0, 0], [0, 0]],
+            Direction.UPLEFT: [[0, 1], [0, 0]],
+        }
+
+        self.assertEqual(
+            [generation.as_serializable for generation in cells.iterate_with_halos(neighboring_halos, width=2)],
+            [
+                [
+                    [1, 0, 0],
+                    [0, 0, 0],
+                    [0, 0, 0],
+                ],
+                [
+                    [1, 0, 0],
+                    [1, 0, 0],
+                    [0, 0, 0],
+                ],
+            ],
+        )
+
+    def test_halo_width_cannot_exceed_the_size_of_the_cells(self):
+        with self.assertRaises(ValueError):
+            list(self.gol_cells_type([[0, 0, 0], [0, 0, 0]]).iterate_with_halos({}, width=3))
@@ -1,35 +1,69 @@
 import asyncio
 from contextlib import asynccontextmanager, contextmanager
 from functools import wraps
-from multiprocessing import Process
+from multiprocessing import Event, Process, synchronize
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import Any, AsyncGenerator, Generator, Optional
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import AsyncMock, Mock, patch
 
+from dgol.checkpoint import read_checkpoint
 from dgol.cells import Direction
+from dgol.hashlife_cells import HashLifeGolCells
 from dgol.process import GolProcess
+from dgol.tile import Cycle
 from dgol.connection import Connection
 
 
 class GolCellsStubToGetIteration:
     iteration_counter = 0
+    is_still = False
 
     def iterate(self, neighbor_borders=None) -> None:
         self.iteration_counter += 1
 
+    def advance(self, generations: int) -> None:
+        self.iteration_counter += generations
+
+    def iterate_interior(self) -> None:
+        return None
+
+    def iterate_rim(self, interior, neighbor_borders=None) -> None:
+        self.iteration_counter += 1
+
     def border_at(self, direction: Direction) -> list[int]:
         return [0]
 
+    def snapshot(self) -> int:
+        return self.iteration_counter
+
+    @classmethod
+    def restore(cls, snapshot: int) -> "GolCellsStubToGetIteration":
+        cells = GolCellsStubToGetIteration()
+        cells.iteration_counter = snapshot
+
+        return cells
+
     @property
     def as_serializable(self) -> list[list[int]]:
         return [[self.iteration_counter]]
 
 
+class GolCellsStubComputingUntilReleased(GolCellsStubToGetIteration):
+    def __init__(self, released: synchronize.Event):
+        self.released = released
+
+    def advance(self, generations: int) -> None:
+        self.released.wait()
+        super().advance(generations)
+
+
 class TestGolProcess(IsolatedAsyncioTestCase):
     @staticmethod
     @contextmanager
-    def create_process(cells: Optional[Any] = None) -> Generator[GolProcess, None, None]:
-        process = GolProcess(cells)
+    def create_process(cells: Optional[Any] = None, **kwargs: Any) -> Generator[GolProcess, None, None]:
+        process = GolProcess(cells, **kwargs)
         try:
             yield process
 
@@ -51,7 +85,7 @@ class TestGolProcess(IsolatedAsyncioTestCase):
 
         @receive_border_cb
         async def ignore(connection):
-            pass
+            await connection.recv()
 
         async def receive_border_called():
             async with neighbor._receive_border_called:
@@ -79,9 +113,9 @@ class TestGolProcess(IsolatedAsyncioTestCase):
         neighbor.receive_border_called = asyncio.create_task(neighbor.receive_border_called_coro_factory())
 
     @staticmethod
-    async def send_border_to(process: GolProcess, border: dict[str, Any]) -> None:
+    async def send_border_to(process: GolProcess, direction: Direction, iteration: int = 0) -> None:
         async with Connection.connect(process.host, process.border_port) as connection:
-            await connection.send(border)
+            await connection.send({"direction": direction.name, "iteration": iteration, "border": "border"})
 
     def test_shall_be_a_process_instance(self):
         with self.create_process() as process:
@@ -128,6 +162,223 @@ class TestGolProcess(IsolatedAsyncioTestCase):
             )
             gol_cells_ctor.assert_called_once_with(cells)
 
+    async def test_cells_engine_can_be_selected(self):
+        cells = [[0]]
+        iteration = 3
+        engine = Mock(return_value=GolCellsStubToGetIteration())
+
+        with self.create_process(cells, engine=engine) as process:
+            self.assertEqual(await process.cells(iteration=iteration), [[iteration]])
+            engine.assert_called_once_with(cells)
+
+    async def test_unconnected_cells_can_skip_many_generations(self):
+        cells = [
+            [0, 0, 0],
+            [1, 1, 1],
+            [0, 0, 0],
+        ]
+
+        with self.create_process(cells, engine=HashLifeGolCells) as process:
+            self.assertEqual(
+                await asyncio.wait_for(process.cells(iteration=10**9 + 1), timeout=1),
+                [
+                    [0, 1, 0],
+                    [0, 1, 0],
+                    [0, 1, 0],
+                ],
+            )
+
+    async def test_unconnected_cells_in_a_cycle_are_not_iterated(self):
+        blinker = [[0, 0, 0], [1, 1, 1], [0, 0, 0]]
+
+        with self.create_process(blinker) as process:
+            self.assertIsNone(process.cycle)
+            self.assertEqual(
+                await asyncio.wait_for(process.cells(iteration=10**9 + 1), timeout=1), [[0, 1, 0], [0, 1, 0], [0, 1, 0]]
+            )
+            self.assertEqual(process.cycle, Cycle(start=0, period=2))
+            self.assertEqual(process.periods_at(2), [2])
+
+    async def test_cycles_found_later_in_a_run_are_followed(self):
+        glider = [[0] * 40 for _ in range(40)]
+        glider[0][1] = glider[1][2] = glider[2][0] = glider[2][1] = glider[2][2] = 1
+
+        with self.create_process(glider) as process:
+            await asyncio.wait_for(process.cells(iteration=10**6), timeout=5)
+
+            self.assertEqual(process.cycle.period, 1)
+
+    async def test_cycles_are_forgotten_when_neighbors_are_connected(self):
+        with (
+            self.create_process([[0, 0, 0], [1, 1, 1], [0, 0, 0]]) as process,
+            self.create_process([[0, 0, 0], [1, 1, 0], [1, 1, 0]]) as process_up,
+        ):
+            await process.cells(iteration=10)
+            await process_up.cells(iteration=10)
+
+            self.assertEqual(process.cycle, Cycle(start=0, period=2))
+
+            process.connect(process_up, Direction.UP)
+
+            self.assertEqual(
+                await asyncio.wait_for(process.cells(iteration=12), timeout=1), [[1, 0, 1], [0, 1, 1], [0, 0, 0]]
+            )
+            self.assertIsNone(process.cycle)
+
+    async def test_cells_of_the_last_generation_are_served_while_iterating(self):
+        released = Event()
+        engine = Mock(return_value=GolCellsStubComputingUntilReleased(released))
+
+        with self.create_process([[0]], engine=engine) as process:
+            iterated = asyncio.create_task(process.cells(iteration=1))
+
+            self.assertEqual(await asyncio.wait_for(process.cells(), timeout=1), [[0]])
+            self.assertIsNone(process.cycle)
+            self.assertFalse(iterated.done())
+
+            released.set()
+
+            self.assertEqual(await asyncio.wait_for(iterated, timeout=1), [[1]])
+
+    async def test_cells_of_past_iterations_are_served_from_the_history(self):
+        with (
+            self.create_process([[0, 0, 0], [0, 0, 0], [0, 0, 0]]) as process,
+            self.create_process([[0, 0, 0], [0, 0, 0], [1, 1, 1]]) as process_up,
+        ):
+            process.connect(process_up, Direction.UP)
+            await process.iterate_for(4)
+
+            self.assertEqual(await process.cells(iteration=1), [[0, 1, 0], [0, 0, 0], [0, 0, 0]])
+            self.assertEqual(await process_up.wait_for_cells(iteration=3), [[0, 0, 0], [0, 1, 0], [0, 1, 0]])
+            self.assertEqual(
+                [rows async for rows in process_up.iter_cells(iteration=2, rows_per_chunk=2)],
+                [[[0, 0, 0], [0, 0, 0]], [[1, 1, 1]]],
+            )
+
+    async def test_evicted_iterations_cannot_be_served(self):
+        glider = [[0, 1, 0, 0, 0], [0, 0, 1, 0, 0], [1, 1, 1, 0, 0], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0]]
+
+        with self.create_process(glider, history_bytes=1) as process:
+            await process.iterate_for(2)
+
+            with self.assertRaisesRegex(ValueError, "evicted"):
+                await process.cells(iteration=1)
+
+            self.assertEqual(len(await process.cells(iteration=2)), 5)
+
+    async def test_number_of_states_kept_is_limited(self):
+        glider = [[0, 1, 0, 0, 0], [0, 0, 1, 0, 0], [1, 1, 1, 0, 0], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0]]
+
+        with self.create_process(glider, state_history=2) as process:
+            await process.iterate_for(3)
+
+            with self.assertRaisesRegex(ValueError, "evicted"):
+                await process.cells(iteration=1)
+
+            self.assertEqual(len(await process.cells(iteration=2)), 5)
+
+    async def test_process_can_be_restored_from_a_checkpoint(self):
+        glider = [[0, 1, 0, 0, 0], [0, 0, 1, 0, 0], [1, 1, 1, 0, 0], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0]]
+
+        with TemporaryDirectory() as directory, self.create_process(glider) as process:
+            path = Path(directory) / "tile.gol"
+            await process.checkpoint(path, 2)
+            await process.wait_for_checkpoints()
+            restored_process = GolProcess.from_checkpoint(path)
+
+            try:
+                self.assertEqual(await restored_process.cells(), await process.cells(iteration=2))
+                self.assertEqual(await restored_process.cells(iteration=4), await process.cells(iteration=4))
+
+                with self.assertRaises(ValueError):
+                    await restored_process.cells(iteration=1)
+
+            finally:
+                restored_process.terminate()
+
+    async def test_checkpoints_of_the_same_file_are_written_in_order(self):
+        with TemporaryDirectory() as directory, self.create_process([[0, 0, 0], [1, 1, 1], [0, 0, 0]]) as process:
+            path = Path(directory) / "tile.gol"
+
+            for iteration in range(1, 6):
+                await process.checkpoint(path, iteration)
+
+            await process.wait_for_checkpoints()
+
+            self.assertEqual(read_checkpoint(path), (5, [[0, 1, 0], [0, 1, 0], [0, 1, 0]]))
+
+    async def test_checkpoints_which_cannot_be_written_raise_errors(self):
+        with TemporaryDirectory() as directory, self.create_process([[0, 0], [0, 0]], history_bytes=1) as process:
+            await process.iterate_for(2)
+
+            with self.assertRaisesRegex(ValueError, "evicted"):
+                await process.checkpoint(Path(directory) / "tile.gol", 1)
+
+            await process.checkpoint(Path(directory) / "missing" / "first.gol", 2)
+            await process.checkpoint(Path(directory) / "missing" / "second.gol", 2)
+            await process.checkpoint(Path(directory) / "tile.gol", 2)
+
+            with self.assertRaisesRegex(ValueError, "first.gol.*second.gol"):
+                await process.wait_for_checkpoints()
+
+            await process.wait_for_checkpoints()
+
+            self.assertEqual(read_checkpoint(Path(directory) / "tile.gol"), (2, [[0, 0], [0, 0]]))
+
+    async def test_cells_can_be_streamed_in_bands_of_rows(self):
+        cells = [[1, 0, 1], [0, 1, 0], [1, 1, 1], [0, 0, 0], [1, 0, 0]]
+
+        with self.create_process(cells) as process:
+            self.assertEqual(
+                [rows async for rows in process.iter_cells(rows_per_chunk=2)], [cells[:2], cells[2:4], cells[4:]]
+            )
+
+    async def test_processes_keep_iterating_while_cells_are_streamed(self):
+        blinker = [[0, 0, 0], [1, 1, 1], [0, 0, 0]]
+
+        with self.create_process(blinker) as process:
+            stream = process.iter_cells(rows_per_chunk=1)
+
+            self.assertEqual(await anext(stream), [[0, 0, 0]])
+            self.assertEqual(await asyncio.wait_for(process.cells(iteration=1), timeout=1), [[0, 1, 0]] * 3)
+            self.assertEqual([rows async for rows in stream], [[[1, 1, 1]], [[0, 0, 0]]])
+
+    async def test_iterated_cells_can_be_waited_for_and_streamed(self):
+        with (
+            self.create_process([[0, 0, 0], [0, 0, 0], [0, 0, 0]]) as process,
+            self.create_process([[0, 0, 0], [0, 0, 0], [1, 1, 1]]) as process_up,
+        ):
+            process.connect(process_up, Direction.UP)
+            self.assertEqual(await process.cells(iteration=1), [[0, 1, 0], [0, 0, 0], [0, 0, 0]])
+
+            self.assertEqual(
+                [rows async for rows in process_up.iter_wait_for_cells(iteration=1, rows_per_chunk=2)],
+                [[[0, 0, 0], [0, 1, 0]], [[0, 1, 0]]],
+            )
+
+    async def test_connected_gol_processes_can_iterate_many_generations_in_one_request(self):
+        with (
+            self.create_process([[0, 0, 0], [0, 0, 0], [0, 0, 0]]) as process,
+            self.create_process([[0, 0, 0], [0, 0, 0], [1, 1, 1]]) as process_up,
+        ):
+            process.connect(process_up, Direction.UP)
+            run = await asyncio.wait_for(process.iterate_for(10), timeout=2)
+
+            self.assertEqual(run.generations, 10)
+            self.assertGreater(run.generations_per_second, 0)
+            self.assertEqual(await process.cells(), [[0, 0, 0], [0, 0, 0], [0, 0, 0]])
+            self.assertEqual(await process_up.wait_for_cells(iteration=10), [[0, 0, 0], [0, 0, 0], [1, 1, 1]])
+            self.assertEqual((await process.iterate_for(1)).generations, 1)
+
+    async def test_unconnected_gol_process_can_iterate_many_generations_in_one_request(self):
+        with self.create_process([[0, 0, 0], [1, 1, 1], [0, 0, 0]]) as process:
+            self.assertEqual((await process.iterate_for(3)).generations, 3)
+            self.assertEqual(await process.cells(), [[0, 1, 0], [0, 1, 0], [0, 1, 0]])
+
+    def test_halo_width_cannot_exceed_the_size_of_the_cells(self):
+        with self.assertRaises(ValueError):
+            GolProcess([[0, 0], [0, 0]], halo_width=3)
+
     def test_gol_processes_can_be_connected(self):
         other_process = Mock(spec=GolProcess, border_port=123)
 
@@ -137,6 +388,13 @@ class TestGolProcess(IsolatedAsyncioTestCase):
             add_neighbor.assert_called_once_with(Direction.UP, other_process.border_port)
             other_process._add_neighbor.assert_called_once_with(Direction.DOWN, process.border_port)
 
+    def test_neighbors_of_connected_gol_processes_are_registered(self):
+        with self.create_process([[0]]) as process, self.create_process([[0]]) as process_up:
+            process.connect(process_up, Direction.UP)
+
+            self.assertEqual(process.neighbors, {Direction.UP: process_up.border_port})
+            self.assertEqual(process_up.neighbors, {Direction.DOWN: process.border_port})
+
     def test_opposite_directions(self):
         for direction, opposite in [
             (Direction.UP, Direction.DOWN),
@@ -177,14 +435,17 @@ class TestGolProcess(IsolatedAsyncioTestCase):
                 process.connect(neighbor_1, direction_1)
                 process.connect(neighbor_2, direction_2)
 
-                await self.send_border_to(process, {"LEFT": "border"})
-                await self.send_border_to(process, {"RIGHT": "border"})
+                await self.send_border_to(process, Direction.LEFT)
+                await self.send_border_to(process, Direction.RIGHT)
 
                 await self.wait_for_receive_border_called(neighbor_1)
                 await self.wait_for_receive_border_called(neighbor_2)
 
-            self.assertEqual(neighbor_1.received_border, {direction_1.opposite.name: border_at(direction_1)})
-            self.assertEqual(neighbor_2.received_border, {direction_2.opposite.name: border_at(direction_2)})
+            def border_message(direction: Direction) -> dict[str, Any]:
+                return {"direction": direction.opposite.name, "iteration": 0, "border": border_at(direction)}
+
+            self.assertEqual(neighbor_1.received_border, border_message(direction_1))
+            self.assertEqual(neighbor_2.received_border, border_message(direction_2))
             neighbor_1.receive_border.assert_awaited_once()
             neighbor_2.receive_border.assert_awaited_once()
 
@@ -198,14 +459,14 @@ class TestGolProcess(IsolatedAsyncioTestCase):
                 process.connect(neighbor_1, direction_1)
                 process.connect(neighbor_2, direction_2)
 
-                await self.send_border_to(process, {direction_1.name: "border"})
+                await self.send_border_to(process, direction_1)
 
                 wait_for_iteration = asyncio.create_task(process.wait_for_cells(iteration=1))
 
                 with self.assertRaises(TimeoutError):
                     await asyncio.wait_for(asyncio.shield(wait_for_iteration), timeout=.1)
 
-                await self.send_border_to(process, {direction_2.name: "border"})
+                await self.send_border_to(process, direction_2)
 
                 self.assertEqual(await wait_for_iteration, [[1]])
 
@@ -217,16 +478,43 @@ class TestGolProcess(IsolatedAsyncioTestCase):
             with self.create_process([[8, 9]]) as process:
                 process.connect(neighbor, direction)
 
-                await self.send_border_to(process, {direction.name: "border"})
+                await self.send_border_to(process, direction)
 
                 self.assertEqual(await process.wait_for_cells(iteration=1), [[1]])
 
-                await self.send_border_to(process, {direction.name: "border"})
+                await self.send_border_to(process, direction, iteration=1)
 
                 self.assertEqual(await process.wait_for_cells(iteration=2), [[2]])
 
             self.assertEqual(neighbor.receive_border.await_count, 2)
 
+    @patch("dgol.process.GolCells", new=Mock(return_value=GolCellsStubToGetIteration()))
+    async def test_borders_of_successive_iterations_are_sent_on_the_same_connection(self):
+        direction = Direction.UP
+
+        async with self.create_neighbor() as neighbor:
+            neighbor.received_borders = []
+
+            @neighbor.receive_border_cb
+            async def save_received_borders(connection):
+                while len(neighbor.received_borders) < 2:
+                    neighbor.received_borders.append(await connection.recv())
+
+            neighbor.receive_border.side_effect = save_received_borders
+
+            with self.create_process([[8, 9]]) as process:
+                process.connect(neighbor, direction)
+
+                await self.send_border_to(process, direction)
+                await self.send_border_to(process, direction, iteration=1)
+
+                self.assertEqual(await process.wait_for_cells(iteration=2), [[2]])
+
+                await self.wait_for_receive_border_called(neighbor)
+
+            neighbor.receive_border.assert_awaited_once()
+            self.assertEqual([border["iteration"] for border in neighbor.received_borders], [0, 1])
+
     @patch("dgol.process.GolCells", new=Mock(return_value=GolCellsStubToGetIteration()))
     async def test_wait_for_iteration_before_setting_again_the_same_border_info(self):
         direction_1 = Direction.UP
@@ -237,17 +525,17 @@ class TestGolProcess(IsolatedAsyncioTestCase):
                 process.connect(neighbor_1, direction_1)
                 process.connect(neighbor_2, direction_2)
 
-                await self.send_border_to(process, {direction_1.name: "border"})
+                await self.send_border_to(process, direction_1)
 
                 await self.wait_for_receive_border_called(neighbor_1)
 
-                await self.send_border_to(process, {direction_1.name: "border"})
+                await self.send_border_to(process, direction_1, iteration=1)
 
                 with self.assertRaises(TimeoutError):
                     # Border is sent to neighbors after receiving and storing any border info.
                     await self.wait_for_receive_border_called(neighbor_1, timeout=.1)
 
-                await self.send_border_to(process, {direction_2.name: "border"})  # Trigger iteration.
+                await self.send_border_to(process, direction_2)  # Trigger iteration.
 
                 self.assertEqual(await process.wait_for_cells(iteration=1), [[1]])
 
@@ -256,6 +544,20 @@ class TestGolProcess(IsolatedAsyncioTestCase):
                 self.assertEqual(neighbor_1.receive_border.await_count, 2)
                 self.assertEqual(neighbor_2.receive_border.await_count, 2)
 
+    @patch("dgol.process.GolCells", new=Mock(return_value=GolCellsStubToGetIteration()))
+    async def test_borders_received_ahead_are_buffered_until_their_iteration(self):
+        direction = Direction.UP
+
+        async with self.create_neighbor() as neighbor:
+            with self.create_process([[8, 9]], look_ahead=2) as process:
+                process.connect(neighbor, direction)
+
+                await self.send_border_to(process, direction, iteration=2)
+                await self.send_border_to(process, direction, iteration=1)
+                await self.send_border_to(process, direction)
+
+                self.assertEqual(await process.wait_for_cells(iteration=3), [[3]])
+
     @patch("dgol.process.GolCells", new=Mock(return_value=GolCellsStubToGetIteration()))
     async def test_iteration_of_connected_gol_processes_is_initiated_by_sending_border(self):
         direction = Direction.UP
@@ -267,7 +569,7 @@ class TestGolProcess(IsolatedAsyncioTestCase):
                 async def receive_border(connection) -> None:
                     await connection.recv()
 
-                    await self.send_border_to(process, {direction.name: "border"})  # Trigger iteration.
+                    await self.send_border_to(process, direction)  # Trigger iteration.
 
                 neighbor.receive_border.side_effect = receive_border
 
@@ -325,3 +627,25 @@ class TestGolProcess(IsolatedAsyncioTestCase):
                     [0, 0, 0],
                 ],
             )
+
+    async def test_connected_gol_processes_can_exchange_borders_without_shared_memory(self):
+        with (
+            self.create_process([[0, 0, 0], [0, 0, 0], [0, 0, 0]], shared_memory=False) as process,
+            self.create_process([[0, 0, 0], [0, 0, 0], [1, 1, 1]], shared_memory=False) as process_up,
+        ):
+            process.connect(process_up, Direction.UP)
+
+            self.assertEqual(await process.cells(iteration=2), [[0, 0, 0], [0, 0, 0], [0, 0, 0]])
+            self.assertEqual(await process_up.wait_for_cells(iteration=2), [[0, 0, 0], [0, 0, 0], [1, 1, 1]])
+
+    async def test_connected_gol_processes_can_iterate_multiple_generations_per_border_exchange(self):
+        with (
+            self.create_process([[0, 0, 0]] * 3, halo_width=2) as process,
+            self.create_process([[0, 0, 0], [0, 0, 0], [1, 1, 1]], halo_width=2) as process_up,
+        ):
+            process.connect(process_up, Direction.UP)
+
+            self.assertEqual(await process.cells(iteration=2), [[0, 0, 0]] * 3)
+            self.assertEqual(await process.wait_for_cells(iteration=1), [[0, 1, 0], [0, 0, 0], [0, 0, 0]])
+            self.assertEqual(await process_up.wait_for_cells(iteration=1), [[0, 0, 0], [0, 1, 0], [0, 1, 0]])
+            self.assertEqual(await process_up.wait_for_cells(iteration=2), [[0, 0, 0], [0, 0, 0], [1, 1, 1]])
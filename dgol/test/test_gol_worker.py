@@ -0,0 +1,102 @@
+from contextlib import contextmanager
+from typing import Any, Generator
+from unittest import IsolatedAsyncioTestCase
+
+from dgol.cells import Direction
+from dgol.test import test_gol_process
+from dgol.worker import GolWorker, WorkerTile
+
+
+class TestGolWorker(IsolatedAsyncioTestCase):
+    @staticmethod
+    @contextmanager
+    def create_worker(tiles: list[list[list[int]]], **kwargs: Any) -> Generator[GolWorker, None, None]:
+        worker = GolWorker(tiles, **kwargs)
+        try:
+            yield worker
+
+        finally:
+            worker.terminate()
+
+    async def test_cells_of_the_tiles_can_be_retrieved(self):
+        with self.create_worker([[[1, 0]], [[0, 1]]]) as worker:
+            self.assertEqual([await tile.cells() for tile in worker.tiles], [[[1, 0]], [[0, 1]]])
+
+    async def test_tiles_of_the_same_worker_can_be_connected(self):
+        with self.create_worker([[[0, 0, 0], [0, 0, 0], [1, 1, 1]], [[0, 0, 0], [0, 0, 0], [0, 0, 0]]]) as worker:
+            tile_up, tile = worker.tiles
+            tile.connect(tile_up, Direction.UP)
+
+            self.assertEqual(await tile.cells(iteration=1), [[0, 1, 0], [0, 0, 0], [0, 0, 0]])
+            self.assertEqual(await tile_up.wait_for_cells(iteration=1), [[0, 0, 0], [0, 1, 0], [0, 1, 0]])
+            self.assertEqual(await tile.cells(iteration=2), [[0, 0, 0], [0, 0, 0], [0, 0, 0]])
+            self.assertEqual(tile.neighbors, {Direction.UP: tile_up.border_port})
+
+    async def test_tiles_can_be_connected_to_tiles_of_other_processes(self):
+        with (
+            self.create_worker([[[0, 0, 0], [0, 0, 0], [1, 1, 1]]]) as worker,
+            test_gol_process.TestGolProcess.create_process([[0, 0, 0], [0, 0, 0], [0, 0, 0]]) as process,
+        ):
+            tile_up, = worker.tiles
+            process.connect(tile_up, Direction.UP)
+
+            self.assertEqual(await process.cells(iteration=1), [[0, 1, 0], [0, 0, 0], [0, 0, 0]])
+            self.assertEqual(await tile_up.wait_for_cells(iteration=1), [[0, 0, 0], [0, 1, 0], [0, 1, 0]])
+
+    async def test_tiles_can_be_distributed_among_workers(self):
+        tiles = GolWorker.start_pool([[[index]] for index in range(5)], workers=2)
+        try:
+            self.assertTrue(all(isinstance(tile, WorkerTile) for tile in tiles))
+            self.assertEqual(len({tile.worker for tile in tiles}), 2)
+            self.assertEqual([await tile.cells() for tile in tiles], [[[index]] for index in range(5)])
+
+        finally:
+            for worker in {tile.worker for tile in tiles}:
+                worker.terminate()
+
+    def test_worker_serves_at_least_one_tile(self):
+        with self.assertRaises(ValueError):
+            GolWorker([])
+
+    async def test_strips_of_cells_can_be_moved_between_neighbors(self):
+        with self.create_worker([[[0, 0, 0], [0, 0, 0], [1, 1, 1]], [[0, 0, 0], [0, 0, 0], [0, 0, 0]]]) as worker:
+            tile_up, tile = worker.tiles
+            tile.connect(tile_up, Direction.UP)
+            await tile.iterate_until(1)
+
+            self.assertGreater(tile.seconds_per_generation, 0)
+
+            tile.add_strip(Direction.UP, tile_up.take_strip(Direction.DOWN, 2, 1), 1)
+
+            self.assertEqual(tile.seconds_per_generation, 0)
+            self.assertEqual(await tile_up.cells(), [[0, 0, 0]])
+            self.assertEqual(await tile.cells(), [[0, 1, 0], [0, 1, 0], [0, 1, 0], [0, 0, 0], [0, 0, 0]])
+            self.assertEqual(await tile.cells(iteration=2), [[0, 0, 0], [1, 1, 1], [0, 0, 0], [0, 0, 0], [0, 0, 0]])
+            self.assertEqual(await tile_up.wait_for_cells(iteration=2), [[0, 0, 0]])
+
+    async def test_strips_are_moved_at_the_iteration_of_the_tiles_only(self):
+        with self.create_worker([[[0, 0], [1, 1]], [[0, 0], [0, 0]]]) as worker:
+            tile_up, tile = worker.tiles
+            tile.connect(tile_up, Direction.UP)
+
+            with self.assertRaises(RuntimeError):
+                tile_up.take_strip(Direction.DOWN, 1, 1)
+
+            with self.assertRaises(ValueError):
+                tile_up.take_strip(Direction.DOWN, 2, 0)
+
+    async def test_strips_leave_at_least_the_halo_width(self):
+        with self.create_worker([[[0] * 3] * 3, [[0] * 3] * 3], halo_width=2) as worker:
+            tile_up, tile = worker.tiles
+            tile.connect(tile_up, Direction.UP)
+
+            with self.assertRaises(ValueError):
+                tile_up.take_strip(Direction.DOWN, 2, 0)
+
+            tile.add_strip(Direction.UP, tile_up.take_strip(Direction.DOWN, 1, 0), 0)
+
+            self.assertEqual(await tile.cells(), [[0] * 3] * 4)
+
+    def test_halo_width_cannot_exceed_the_size_of_the_tiles(self):
+        with self.assertRaises(ValueError):
+            GolWorker([[[0, 0], [0, 0]]], halo_width=3)
@@ -0,0 +1,65 @@
+from dgol.cells import Direction, GolCells
+from dgol.hashlife_cells import HashLifeGolCells
+from dgol.test import test_gol_cells
+
+
+class TestHashLifeGolCells(test_gol_cells.TestGolCells):
+    gol_cells_type = HashLifeGolCells
+
+    def test_serializable_data_can_be_retrieved(self):
+        cells = [
+            [1, 0, 1],
+            [0, 1, 1],
+            [0, 0, 1],
+        ]
+
+        self.assertEqual(HashLifeGolCells(cells).as_serializable, cells)
+
+    def test_border_cells_can_be_retrieved(self):
+        cells = HashLifeGolCells(
+            [
+                [1, 1, 0],
+                [0, 0, 1],
+                [1, 0, 0],
+            ]
+        )
+
+        for direction, border_cells in {
+            Direction.UP: [1, 1, 0],
+            Direction.UPRIGHT: [0],
+            Direction.RIGHT: [0, 1, 0],
+            Direction.DOWNRIGHT: [0],
+            Direction.DOWN: [1, 0, 0],
+            Direction.DOWNLEFT: [1],
+            Direction.LEFT: [1, 0, 1],
+            Direction.UPLEFT: [1],
+        }.items():
+            with self.subTest(direction=direction):
+                self.assertEqual(cells.border_at(direction), border_cells)
+
+    def test_advancing_many_generations_equals_iterating_them(self):
+        glider = [
+            [0, 1, 0, 0, 0, 0, 0],
+            [0, 0, 1, 0, 0, 0, 0],
+            [1, 1, 1, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0],
+        ]
+
+        for generations in [1, 5, 12, 100]:
+            with self.subTest(generations=generations):
+                cells = HashLifeGolCells(glider)
+                expected_cells = GolCells([row[:] for row in glider])
+
+                cells.advance(generations)
+                expected_cells.advance(generations)
+
+                self.assertEqual(cells.as_serializable, expected_cells.as_serializable)
+
+    def test_cache_size_is_bounded(self):
+        cells = HashLifeGolCells([[1, 1, 0, 1], [0, 1, 1, 1], [1, 0, 0, 1]], cache_size=64)
+
+        cells.advance(100)
+
+        self.assertLessEqual(len(cells._nodes), 64)
+        self.assertLessEqual(len(cells._futures), 64)
@@ -0,0 +1,12 @@
+from importlib.util import find_spec
+from unittest import skipUnless
+
+from dgol.test import test_gol_cells
+
+
+@skipUnless(find_spec("numpy"), "NumPy is not installed")
+class TestNumpyGolCells(test_gol_cells.TestGolCells):
+    def setUp(self):
+        from dgol.numpy_cells import NumpyGolCells
+
+        self.gol_cells_type = NumpyGolCells
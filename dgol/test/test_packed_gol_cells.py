@@ -0,0 +1,59 @@
+from dgol.cells import Direction
+from dgol.packed_cells import PackedGolCells, pack, unpack
+from dgol.test import test_gol_cells
+
+
+class TestPackedGolCells(test_gol_cells.TestGolCells):
+    gol_cells_type = PackedGolCells
+
+    def test_serializable_data_can_be_retrieved(self):
+        cells = [
+            [1, 0, 1],
+            [0, 1, 1],
+            [0, 0, 1],
+        ]
+
+        self.assertEqual(PackedGolCells(cells).as_serializable, cells)
+
+    def test_border_cells_can_be_retrieved(self):
+        cells = PackedGolCells(
+            [
+                [1, 1, 0],
+                [0, 0, 1],
+                [1, 0, 0],
+            ]
+        )
+
+        for direction, border_cells in {
+            Direction.UP: [1, 1, 0],
+            Direction.UPRIGHT: [0],
+            Direction.RIGHT: [0, 1, 0],
+            Direction.DOWNRIGHT: [0],
+            Direction.DOWN: [1, 0, 0],
+            Direction.DOWNLEFT: [1],
+            Direction.LEFT: [1, 0, 1],
+            Direction.UPLEFT: [1],
+        }.items():
+            with self.subTest(direction=direction):
+                self.assertEqual(cells.border_at(direction), border_cells)
+                self.assertEqual(cells.packed_border_at(direction), pack(border_cells))
+
+    def test_packed_neighboring_borders_are_taken_into_account(self):
+        cells = PackedGolCells([[0, 0, 0]] * 3)
+
+        cells.iterate({Direction.UP: pack([1, 1, 1]), Direction.LEFT: [1, 0, 0], Direction.UPLEFT: 1})
+
+        self.assertEqual(
+            cells.as_serializable,
+            [
+                [0, 1, 0],
+                [0, 0, 0],
+                [0, 0, 0],
+            ],
+        )
+
+    def test_cells_can_be_packed_and_unpacked(self):
+        cells = [0, 1, 1, 0, 0, 1]
+
+        self.assertEqual(pack(cells), 0b100110)
+        self.assertEqual(unpack(pack(cells), len(cells)), cells)
@@ -0,0 +1,32 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from dgol.patterns import format_plaintext, parse_plaintext, parse_run_length_encoded, read_pattern
+
+
+class TestPatterns(TestCase):
+    def test_plaintext_patterns_can_be_parsed(self):
+        self.assertEqual(parse_plaintext("!Name: Glider\n.O\n..O\nOOO\n"), [[0, 1, 0], [0, 0, 1], [1, 1, 1]])
+
+    def test_cells_can_be_formatted_as_plaintext(self):
+        cells = [[0, 1, 0], [0, 0, 1], [1, 1, 1]]
+
+        self.assertEqual(format_plaintext(cells), ".O.\n..O\nOOO\n")
+        self.assertEqual(parse_plaintext(format_plaintext(cells)), cells)
+
+    def test_run_length_encoded_patterns_can_be_parsed(self):
+        self.assertEqual(
+            parse_run_length_encoded("#N Glider\nx = 3, y = 4, rule = B3/S23\nbo$2bo$3o!\n"),
+            [[0, 1, 0], [0, 0, 1], [1, 1, 1], [0, 0, 0]],
+        )
+        self.assertEqual(parse_run_length_encoded("o2$o!"), [[1], [0], [1]])
+
+    def test_patterns_can_be_read_from_files(self):
+        with TemporaryDirectory() as directory:
+            for name, content in [("glider.cells", ".O\n..O\nOOO"), ("glider.rle", "x = 3, y = 3\nbo$2bo$3o!")]:
+                with self.subTest(name=name):
+                    path = Path(directory) / name
+                    path.write_text(content)
+
+                    self.assertEqual(read_pattern(path), [[0, 1, 0], [0, 0, 1], [1, 1, 1]])
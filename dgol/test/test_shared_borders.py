@@ -0,0 +1,32 @@
+from unittest import TestCase
+
+from dgol.cells import Direction
+from dgol.shared_borders import SharedBorders, SharedBordersReader
+
+
+class TestSharedBorders(TestCase):
+    def setUp(self):
+        self.shared_borders = SharedBorders(slot_size=4, generations_per_exchange=2)
+        self.addCleanup(self.shared_borders.close)
+
+        self.reader = SharedBordersReader()
+        self.addCleanup(self.reader.close)
+
+    def read(self, location: bytes) -> bytes:
+        with self.reader.read(location) as border:
+            return bytes(border)
+
+    def test_borders_can_be_read_by_the_neighbors(self):
+        location = self.shared_borders.write(Direction.LEFT, 0, b"abc")
+
+        self.assertEqual(self.read(location), b"abc")
+
+    def test_borders_of_successive_exchanges_are_written_to_different_slots(self):
+        locations = [self.shared_borders.write(Direction.UP, iteration, bytes([iteration])) for iteration in (0, 2, 4)]
+
+        self.assertNotEqual(locations[0], locations[1])
+        self.assertEqual(locations[0], locations[2])
+        self.assertEqual(self.read(locations[1]), b"\x02")
+
+    def test_borders_not_fitting_in_a_slot_are_not_written(self):
+        self.assertIsNone(self.shared_borders.write(Direction.DOWN, 0, b"abcde"))
@@ -0,0 +1,24 @@
+from dgol.cells import Direction
+from dgol.sparse_cells import SparseGolCells
+from dgol.test import test_gol_cells
+from dgol.tile import state_size
+
+
+class TestSparseGolCells(test_gol_cells.TestGolCells):
+    gol_cells_type = SparseGolCells
+
+    def test_only_alive_cells_are_stored(self):
+        cells = SparseGolCells([[0] * 100 for _ in range(100)])
+
+        self.assertEqual(cells.population, 0)
+
+        cells.iterate({Direction.UP: [0] * 49 + [1, 1, 1] + [0] * 48})
+
+        self.assertEqual(cells.population, 1)
+        self.assertEqual(cells.border_at(Direction.UP), [0] * 50 + [1] + [0] * 49)
+
+    def test_snapshots_take_a_few_bytes_per_alive_cell(self):
+        cells = SparseGolCells([[0] * 100 for _ in range(100)])
+        cells.iterate({Direction.UP: [0] * 49 + [1, 1, 1] + [0] * 48})
+
+        self.assertEqual(state_size(cells.snapshot()), 4 + 2)
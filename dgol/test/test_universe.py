@@ -0,0 +1,205 @@
+import asyncio
+from contextlib import ExitStack, contextmanager
+from importlib.util import find_spec
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Generator
+from unittest import IsolatedAsyncioTestCase, skipUnless
+from unittest.mock import patch
+
+from dgol.active_cells import ActiveGolCells
+from dgol.cells import GolCells
+from dgol.patterns import read_pattern
+from dgol.tile import Cycle
+from dgol.universe import Universe, split
+from dgol.worker import WorkerTile
+
+GLIDER = [
+    [0, 1, 0, 0, 0, 0, 0],
+    [0, 0, 1, 0, 0, 0, 0],
+    [1, 1, 1, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0],
+]
+
+
+def toroidal_generation(cells: list[list[int]]) -> list[list[int]]:
+    rows, columns = len(cells), len(cells[0])
+
+    def neighbors(row: int, column: int) -> int:
+        return sum(
+            cells[(row + row_offset) % rows][(column + column_offset) % columns]
+            for row_offset in (-1, 0, 1)
+            for column_offset in (-1, 0, 1) if row_offset or column_offset
+        )
+
+    return [
+        [int(neighbors(row, column) == 3 or neighbors(row, column) == 2 and cells[row][column]) for column in range(columns)]
+        for row in range(rows)
+    ]
+
+
+class TestUniverse(IsolatedAsyncioTestCase):
+    @staticmethod
+    @contextmanager
+    def create_universe(cells: list[list[int]], **kwargs: Any) -> Generator[Universe, None, None]:
+        universe = Universe(cells, **kwargs)
+        try:
+            yield universe
+
+        finally:
+            universe.terminate()
+
+    @staticmethod
+    async def cells_of(universe: Universe, iteration: int) -> list[list[int]]:
+        tile_cells = [[await tile.cells(iteration) for tile in tile_row] for tile_row in universe.tiles]
+
+        return [sum(rows, []) for tile_row in tile_cells for rows in zip(*tile_row)]
+
+    def test_ranges_are_split_balanced(self):
+        self.assertEqual(split(10, 4), [0, 2, 5, 7, 10])
+
+    async def test_universe_is_split_into_tiles_of_at_most_the_given_shape(self):
+        with self.create_universe(GLIDER, tile_shape=(4, 3), workers=2) as universe:
+            self.assertEqual((len(universe.tiles), len(universe.tiles[0])), (2, 3))
+            self.assertEqual(universe.row_bounds, [0, 3, 6])
+            self.assertEqual(universe.column_bounds, [0, 2, 4, 7])
+            self.assertEqual(len(universe.workers), 2)
+            self.assertEqual(await self.cells_of(universe, 0), GLIDER)
+
+    async def test_universe_is_split_into_a_tile_per_worker_by_default(self):
+        with self.create_universe(GLIDER, workers=4) as universe:
+            self.assertEqual((len(universe.tiles), len(universe.tiles[0])), (2, 2))
+            self.assertEqual(len(universe.workers), 4)
+
+    async def test_tiles_are_connected_in_all_directions(self):
+        expected_cells = GolCells([row.copy() for row in GLIDER])
+        expected_cells.advance(8)
+
+        with self.create_universe(GLIDER, tile_shape=(2, 2), workers=3) as universe:
+            self.assertEqual(await self.cells_of(universe, 8), expected_cells.as_serializable)
+
+    async def test_universe_can_be_toroidal(self):
+        expected_cells = GLIDER
+
+        for _ in range(12):
+            expected_cells = toroidal_generation(expected_cells)
+
+        for engine in (GolCells, ActiveGolCells):
+            with self.subTest(engine=engine.__name__), self.create_universe(
+                GLIDER, tile_shape=(3, 4), workers=2, wrap=True, engine=engine
+            ) as universe:
+                self.assertEqual(await self.cells_of(universe, 12), expected_cells)
+
+    async def test_universe_can_be_gathered(self):
+        expected_cells = GolCells([row.copy() for row in GLIDER])
+        expected_cells.advance(4)
+
+        with self.create_universe(GLIDER, tile_shape=(2, 3), workers=2) as universe:
+            self.assertEqual(await universe.gather(4, parallelism=2, rows_per_chunk=1), expected_cells.as_serializable)
+
+    async def test_region_is_gathered_from_the_intersecting_tiles_only(self):
+        with self.create_universe(GLIDER, tile_shape=(2, 3), workers=2) as universe:
+            with ExitStack() as stack:
+                iter_cells = [
+                    [stack.enter_context(patch.object(tile, "iter_cells", wraps=tile.iter_cells)) for tile in tile_row]
+                    for tile_row in universe.tiles
+                ]
+
+                self.assertEqual(await universe.gather(region=(1, 1, 3, 4)), [[0, 1, 0], [1, 1, 0]])
+
+            self.assertEqual(
+                [[mock.called for mock in mocks] for mocks in iter_cells],
+                [[True, True, False], [True, True, False], [False, False, False]],
+            )
+
+    @skipUnless(find_spec("numpy"), "NumPy is not installed")
+    async def test_universe_can_be_gathered_into_a_preallocated_array(self):
+        import numpy
+
+        out = numpy.zeros((6, 7), dtype=numpy.uint8)
+
+        with self.create_universe(GLIDER, tile_shape=(4, 4), workers=2) as universe:
+            self.assertIs(await universe.gather(out=out), out)
+
+        self.assertEqual(out.tolist(), GLIDER)
+
+    async def test_universe_can_be_gathered_to_a_file(self):
+        expected_cells = GLIDER
+
+        for _ in range(3):
+            expected_cells = toroidal_generation(expected_cells)
+
+        with TemporaryDirectory() as directory, self.create_universe(GLIDER, tile_shape=(2, 2), wrap=True) as universe:
+            path = Path(directory) / "universe.cells"
+            await universe.gather_to_file(path, 3)
+
+            self.assertEqual(read_pattern(path), expected_cells)
+
+    async def test_bounds_are_moved_toward_the_busy_tiles(self):
+        expected_cells = GolCells([row.copy() for row in GLIDER])
+        expected_cells.advance(8)
+
+        with self.create_universe(GLIDER, tile_shape=(2, 3), workers=2) as universe:
+            busy_tiles = {tile.border_port for tile in universe.tiles[0]}
+            seconds_per_generation = property(lambda tile: 3.0 if tile.border_port in busy_tiles else 1.0)
+
+            with patch.object(WorkerTile, "seconds_per_generation", seconds_per_generation):
+                self.assertTrue(await universe.rebalance(2))
+                self.assertFalse(await universe.rebalance(2, tolerance=3))
+
+            self.assertEqual(universe.row_bounds, [0, 1, 4, 6])
+            self.assertEqual(universe.column_bounds, [0, 2, 4, 7])
+            self.assertEqual(await universe.gather(8), expected_cells.as_serializable)
+
+    def test_tiles_cannot_be_smaller_than_the_halo_width(self):
+        with self.assertRaises(ValueError):
+            Universe(GLIDER, tile_shape=(2, 2), halo_width=3)
+
+    async def test_busy_tiles_keep_the_halo_width(self):
+        with self.create_universe(GLIDER, tile_shape=(3, 7), workers=2, halo_width=2) as universe:
+            busy_tiles = {tile.border_port for tile in universe.tiles[0]}
+            seconds_per_generation = property(lambda tile: 100.0 if tile.border_port in busy_tiles else 1.0)
+
+            with patch.object(WorkerTile, "seconds_per_generation", seconds_per_generation):
+                self.assertTrue(await universe.rebalance(2))
+
+            self.assertEqual(universe.row_bounds, [0, 2, 6])
+
+    async def test_bounds_are_not_moved_without_measured_loads(self):
+        with self.create_universe(GLIDER, tile_shape=(3, 7), workers=2) as universe:
+            self.assertFalse(await universe.rebalance(0))
+            self.assertEqual(universe.row_bounds, [0, 3, 6])
+
+    async def test_cycles_of_the_universe_are_detected_and_followed(self):
+        blinkers = [[0] * 7, [1, 1, 1, 0, 0, 1, 0], [0, 0, 0, 0, 0, 1, 0], [0, 0, 0, 0, 0, 1, 0], [0] * 7]
+
+        with self.create_universe(blinkers, tile_shape=(3, 3), workers=2) as universe:
+            self.assertEqual(await universe.detect_cycle(4), Cycle(start=2, period=2))
+            self.assertEqual(await asyncio.wait_for(universe.gather(10**9), timeout=1), blinkers)
+
+        with self.create_universe(GLIDER, tile_shape=(3, 3), workers=2, wrap=True) as universe:
+            self.assertIsNone(await universe.detect_cycle(4))
+
+    async def test_universe_can_be_restored_from_a_checkpoint(self):
+        with TemporaryDirectory() as directory:
+            with self.create_universe(GLIDER, tile_shape=(2, 3), workers=2, wrap=True) as universe:
+                await universe.checkpoint(directory, 3)
+                await universe.wait_for_checkpoints()
+                expected_cells = await universe.gather(5)
+
+            universe = Universe.from_checkpoint(directory, workers=2, wrap=True)
+
+            try:
+                self.assertEqual(universe.row_bounds, [0, 2, 4, 6])
+                self.assertEqual(universe.column_bounds, [0, 2, 4, 7])
+                self.assertEqual(await universe.gather(5), expected_cells)
+
+            finally:
+                universe.terminate()
+
+            (Path(directory) / "tile-0-0.gol").unlink()
+
+            with self.assertRaises(ValueError):
+                Universe.from_checkpoint(directory)
@@ -0,0 +1,895 @@
+import asyncio
+import ipaddress
+import sys
+import time
+from abc import ABC, abstractmethod
+from asyncio import IncompleteReadError
+from collections import defaultdict, deque
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Hashable
+from contextlib import asynccontextmanager, suppress
+from pathlib import Path
+from typing import Any, NamedTuple, Self, TypeVar, cast
+
+from dgol.cells import Direction, GolCells
+from dgol.checkpoint import write_checkpoint
+from dgol.connection import Connection
+from dgol.shared_borders import SharedBorders
+from dgol.topology import Topology
+
+T = TypeVar("T")
+
+# The load of a tile is measured over its last exchanges, so it follows the activity moving across the universe.
+TIMED_EXCHANGES = 8
+
+# Default number of states of the cells kept per tile, cycles up to this period are detected.
+STATE_HISTORY = 64
+
+# Memory budget of the states kept per tile, the oldest states are evicted beyond it.
+HISTORY_BYTES = 64 * 2**20
+
+
+def shared_borders_slot_size(cells: list[list[int]], halo_width: int) -> int:
+    """Bytes of the packed borders of the cells, the encoded borders fitting in them are published in shared memory.
+
+    The rows of the borders are packed to whole bytes, the halos on the sides have a row per row of the cells.
+    """
+
+    length = max(len(cells), len(cells[0]) if cells else 0, halo_width)
+
+    if halo_width == 1:
+        return (length + 7) // 8
+
+    return max(halo_width * ((length + 7) // 8), length * ((halo_width + 7) // 8))
+
+
+def state_size(state: Any) -> int:
+    """Approximate bytes of a snapshot of the cells, made of packed integers and bytes."""
+
+    match state:
+        case bytes(): return len(state)
+        case int(): return (state.bit_length() + 7) // 8
+        case tuple(): return sum(map(state_size, state))
+        case _: return sys.getsizeof(state)
+
+
+class Cycle(NamedTuple):
+    """The states of the cells repeat every `period` generations from the iteration `start` on."""
+
+    start: int
+    period: int
+
+    def phase(self, iteration: int) -> int:
+        return (iteration - self.start) % self.period
+
+
+class Run(NamedTuple):
+    """The tile has iterated `generations` generations in `seconds`."""
+
+    generations: int
+    seconds: float
+
+    @property
+    def generations_per_second(self) -> float:
+        return self.generations / self.seconds if self.seconds else 0.0
+
+
+class GolTile:
+    """Cells of a tile of the universe, iterated as the borders are exchanged with the neighboring tiles.
+
+    The tile serves its borders, its cells and its iterated cells on its own ports in the event loop of the process
+    hosting it. The borders to the tiles of `local_tiles`, which are hosted by the same process, are handed over
+    in memory. With a `shared_borders_slot_size`, the other borders are published in shared memory
+    if the neighbors are on the same host.
+
+    The snapshots of the last `state_history` states of the cells are kept within `history_bytes`,
+    so the cells of these iterations are served exactly after the tile has iterated further.
+    Whichever limit is reached first evicts the oldest states. Every state is compared with the recorded ones
+    to find cycles, so the count bounds the cost of recording a state.
+    """
+
+    def __init__(
+        self,
+        cells: GolCells,
+        topology: Topology,
+        host: str = "127.0.0.1",
+        halo_width: int = 1,
+        look_ahead: int = 1,
+        shared_borders_slot_size: int | None = None,
+        local_tiles: dict[int, Self] | None = None,
+        history_bytes: int = HISTORY_BYTES,
+        state_history: int = STATE_HISTORY,
+        iteration: int = 0,
+    ):
+        if halo_width > 1 and halo_width > min(cells.shape):
+            raise ValueError(f"Halo width {halo_width} exceeds the size {cells.shape} of the cells")
+
+        self.host = host
+        self.border_port = self.cells_server_port = self.wait_for_cells_server_port = 0
+        self.local_tiles = local_tiles if local_tiles is not None else {}
+        self._topology = topology
+
+        self.border_inbox: dict[tuple[int, Direction], Any] = {}
+        self.halo_width = halo_width
+        self.look_ahead = look_ahead
+
+        self.iteration = self._run_until = iteration
+        self._cells = cells
+        self._cells_of_last_exchange: dict[int, GolCells] = {}
+        self._neighbor_borders: dict[Direction, Any] = {}
+
+        self.has_iterated = asyncio.Condition()
+        self.is_border_sent = False
+        self._interior: asyncio.Future | None = None
+        self._is_iterating = False
+        self._restored_cells: tuple[int, GolCells] | None = None
+        self._checkpoint_written: asyncio.Task | None = None
+        self._checkpoint_errors: list[Exception] = []
+
+        self._neighbor_connections: dict[int, Connection] = {}
+        self._neighbor_connection_locks: defaultdict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._handed_over_borders: dict[int, asyncio.Queue] = {}
+        self._receiving_tasks: set[asyncio.Task] = set()
+
+        self._shared_borders_slot_size = shared_borders_slot_size
+        self._shared_borders: SharedBorders | None = None
+
+        self.generation_seconds: deque[float] = deque(maxlen=TIMED_EXCHANGES)
+        self._exchange_seconds = 0.0
+
+        self._cycle: Cycle | None = None
+        self._cycle_neighbors: dict[Direction, int] = {}
+        self._states: dict[int, Hashable] = {}
+        self._states_bytes = 0
+        self._history_bytes = history_bytes
+        self._state_history = state_history
+        self._evicted_until = iteration
+        self._cycle_states: list[Hashable] = []
+        self._record_state(iteration, cells.snapshot())
+
+    @property
+    def neighbors(self) -> dict[Direction, int]:
+        return self._topology.neighbors_of(self.border_port)
+
+    @property
+    def cycle(self) -> Cycle | None:
+        """The cycle the tile follows, forgotten once the tile is connected to other neighbors than when it was found,
+        as they drive the tile out of it."""
+
+        if self._cycle and self.neighbors != self._cycle_neighbors:
+            self._forget_cycle()
+
+        return self._cycle
+
+    def _forget_cycle(self) -> None:
+        self._cycle, self._cycle_states = None, []
+
+    @property
+    def seconds_per_generation(self) -> float:
+        """Time spent computing a generation, waiting for the neighbors excluded, 0 if not measured yet."""
+
+        return sum(self.generation_seconds) / len(self.generation_seconds) if self.generation_seconds else 0.0
+
+    async def serve(self, started: Callable[[], None]) -> None:
+        """Serves until cancelled, `started` is called when the ports are known."""
+
+        border_server = await Connection.start_server(self._receive_border, self.host)
+        self.border_port = Connection.port_of(border_server)
+
+        wait_for_cells_server = await Connection.start_server(self._wait_for_cells, self.host)
+        self.wait_for_cells_server_port = Connection.port_of(wait_for_cells_server)
+
+        cells_server = await Connection.start_server(self._send_cells, self.host)
+        self.cells_server_port = Connection.port_of(cells_server)
+
+        if self._shared_borders_slot_size is not None and ipaddress.ip_address(self.host).is_loopback:
+            self._shared_borders = SharedBorders(self._shared_borders_slot_size, self.halo_width)
+
+        started()
+
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                task_group.create_task(border_server.serve_forever())
+                task_group.create_task(wait_for_cells_server.serve_forever())
+                task_group.create_task(cells_server.serve_forever())
+
+        finally:
+            # The checkpoint files requested before the tile is stopped are still written.
+            if self._checkpoint_written:
+                await asyncio.wait([self._checkpoint_written])
+
+            for connection in self._neighbor_connections.values():
+                await connection.aclose()
+
+            if self._shared_borders:
+                self._shared_borders.close()
+
+    async def _receive_border(self, connection: Connection) -> None:
+        """A neighbor sends the borders of all iterations on the same connection until it closes it."""
+
+        with suppress(IncompleteReadError):
+            while True:
+                await self._receive_border_message(await connection.recv())
+
+    def hand_over_border(self, border_port: int, message: dict[str, Any]) -> None:
+        """A tile in the same process hands over its borders in memory instead of sending them on a connection.
+
+        The borders of each tile are received in the order they are handed over, as on a connection.
+        """
+
+        if (queue := self._handed_over_borders.get(border_port)) is None:
+            queue = self._handed_over_borders[border_port] = asyncio.Queue()
+            self._receiving_tasks.add(asyncio.create_task(self._receive_handed_over_borders(queue)))
+
+        queue.put_nowait(message)
+
+    async def _receive_handed_over_borders(self, queue: asyncio.Queue) -> None:
+        while True:
+            await self._receive_border_message(await queue.get())
+
+    async def _receive_border_message(self, message: dict[str, Any]) -> None:
+        direction, iteration = Direction[message["direction"]], message["iteration"]
+
+        async with self.has_iterated:
+            await self.has_iterated.wait_for(lambda: iteration <= self.iteration + self.look_ahead * self.halo_width)
+
+        if iteration < self.iteration or (iteration, direction) in self.border_inbox:
+            return  # Border resent after reconnection.
+
+        self.border_inbox[(iteration, direction)] = message["border"]
+
+        await self._process_border_inbox()
+
+    async def _process_border_inbox(self) -> None:
+        """Receiving any border of the current iteration triggers sending the borders of this process once,
+        receiving all of them triggers the iteration. Borders received ahead are processed after the iteration.
+
+        Until the iteration run to, the borders are sent as soon as the tile has iterated.
+        """
+
+        while self.iteration < self._run_until or any(
+            iteration == self.iteration for iteration, _ in self.border_inbox
+        ):
+            if not self.is_border_sent:
+                self.is_border_sent = True
+
+                await self._send_border()
+
+            directions = list(self.neighbors)
+
+            if any((self.iteration, direction) not in self.border_inbox for direction in directions):
+                return
+
+            neighbor_borders = {
+                direction: self.border_inbox.pop((self.iteration, direction)) for direction in directions
+            }
+            interior = await self._interior if self._interior else None
+
+            async with self._iterating():
+                await self._iterate(interior, neighbor_borders)
+                self.is_border_sent = False
+
+    @asynccontextmanager
+    async def _iterating(self) -> AsyncGenerator[None]:
+        """The cells must not be iterated twice at once, nor have their bounds moved while they are iterated.
+
+        The lock is not held while the cells are iterated, so the event loop keeps serving meanwhile,
+        see `_cells_at`.
+        """
+
+        async with self.has_iterated:
+            await self.has_iterated.wait_for(lambda: not self._is_iterating)
+            self._is_iterating = True
+
+        try:
+            yield
+
+        finally:
+            async with self.has_iterated:
+                self._is_iterating = False
+                self._restored_cells = None
+                self.has_iterated.notify_all()
+
+    async def _computed(self, compute: Callable[[], T]) -> T:
+        """The cells are computed in the executor, the event loop only coordinates the tiles."""
+
+        return await asyncio.get_running_loop().run_in_executor(None, self._timed, compute)
+
+    async def _iterate(self, interior: Any, neighbor_borders: dict[Direction, Any]) -> None:
+        if self.halo_width == 1:
+            # Nothing changes on a still tile whose neighbors have not changed their borders, so it is not computed.
+            is_unchanged = self._cells.is_still and neighbor_borders == self._neighbor_borders
+
+            state = self._states.get(self.iteration) if is_unchanged else None
+
+            if state is None:
+                state = await self._computed(
+                    lambda: self._snapshot_after(self._cells.iterate_rim, interior, neighbor_borders)
+                )
+
+            self._neighbor_borders = neighbor_borders
+            self._interior = None
+            self.iteration += 1
+            self._exchange_timed(1)
+            self._record_state(self.iteration, state)
+
+            return
+
+        generations = await self._computed(
+            lambda: [
+                (cells, cells.snapshot()) for cells in self._cells.iterate_with_halos(neighbor_borders, self.halo_width)
+            ]
+        )
+        self._cells_of_last_exchange = {
+            iteration: cells for iteration, (cells, _) in enumerate(generations, start=self.iteration + 1)
+        }
+        self.iteration += self.halo_width
+        self._cells = self._cells_of_last_exchange[self.iteration]
+        self._exchange_timed(self.halo_width)
+
+        for iteration, (_, state) in enumerate(generations, start=self.iteration - self.halo_width + 1):
+            self._record_state(iteration, state)
+
+    def _snapshot_after(self, compute: Callable[..., Any], *args: Any) -> Hashable:
+        """The snapshot for the history is taken in the executor too, right after the cells are computed."""
+
+        compute(*args)
+
+        return self._cells.snapshot()
+
+    def _timed(self, compute: Callable[[], T]) -> T:
+        """Also called in the executor computing the interior, which is done before the exchange is timed."""
+
+        start = time.perf_counter()
+
+        try:
+            return compute()
+
+        finally:
+            self._exchange_seconds += time.perf_counter() - start
+
+    def _exchange_timed(self, generations: int) -> None:
+        self.generation_seconds.append(self._exchange_seconds / generations)
+        self._exchange_seconds = 0.0
+
+    def _record_state(self, iteration: int, state: Hashable) -> None:
+        """The oldest states are evicted beyond the size of the history, the last state is always kept."""
+
+        self._states[iteration] = state
+        self._states_bytes += state_size(state)
+
+        while len(self._states) > 1 and (
+            len(self._states) > self._state_history or self._states_bytes > self._history_bytes
+        ):
+            evicted_iteration = next(iter(self._states))
+            self._states_bytes -= state_size(self._states.pop(evicted_iteration))
+            self._evicted_until = evicted_iteration + 1
+
+    def _clear_states(self, iteration: int) -> None:
+        """The states before the iteration no longer apply to the cells."""
+
+        self._states, self._states_bytes, self._evicted_until = {}, 0, iteration
+        self._record_state(iteration, self._cells.snapshot())
+
+    def _state_at(self, iteration: int) -> Hashable:
+        if (state := self._states.get(iteration)) is not None:
+            return state
+
+        if self.cycle and iteration >= self.cycle.start:
+            return self._cycle_states[self.cycle.phase(iteration)]
+
+        if iteration < self._evicted_until:
+            raise ValueError(f"The state of iteration {iteration} has been evicted from the history of the tile")
+
+        raise ValueError(f"The state of iteration {iteration} has been skipped, the tile is at {self.iteration}")
+
+    def periods_at(self, iteration: int) -> list[int]:
+        """The periods the state of the tile at the iteration repeats an earlier recorded state with, ascending.
+
+        The tile alone may still be driven out of its cycle by its neighbors, see `Universe.detect_cycle`.
+        """
+
+        if (state := self._states.get(iteration)) is None:
+            raise ValueError(f"The state of iteration {iteration} is not recorded")
+
+        return [
+            iteration - earlier_iteration
+            for earlier_iteration, earlier_state in reversed(self._states.items())
+            if earlier_iteration < iteration and earlier_state == state
+        ]
+
+    def follow_cycle(self, cycle: Cycle) -> None:
+        """The later iterations are answered with the recorded states of the cycle instead of being iterated."""
+
+        if any(cycle.start + phase not in self._states for phase in range(cycle.period)):
+            raise ValueError(f"The states of the cycle {cycle} are not recorded")
+
+        self._cycle, self._cycle_neighbors = Cycle(*cycle), self.neighbors
+        self._cycle_states = [self._states[cycle.start + phase] for phase in range(cycle.period)]
+
+    def _recorded_cycle(self, periods: list[int]) -> Cycle | None:
+        """The cycle of the shortest of the periods ending at the current iteration whose states are all recorded."""
+
+        for period in periods:
+            cycle = Cycle(self.iteration - period, period)
+
+            if all(cycle.start + phase in self._states for phase in range(period)):
+                return cycle
+
+        return None
+
+    def _fast_forward(self, iteration: int) -> None:
+        state = self._cycle_states[cast(Cycle, self.cycle).phase(iteration)]
+        self._cells = type(self._cells).restore(state)
+        self._cells_of_last_exchange = {}
+        self.iteration = iteration
+        self._record_state(iteration, state)
+
+    async def _advance(self, iteration: int) -> None:
+        """Without neighbors, the tile is a universe of its own, so any repeated state starts a cycle.
+
+        The first generations are iterated one by one to find a cycle, the others in chunks of as many generations
+        as states are kept, whose states are recorded too. A state repeated after some chunks is periodic, the next
+        generations are then iterated one by one again until all the states of the cycle are recorded.
+        """
+
+        single_generations = self._state_history
+
+        while self.iteration < iteration and self.cycle is None:
+            generations = min(1 if single_generations else self._state_history, iteration - self.iteration)
+            single_generations = max(single_generations - 1, 0)
+            state = await self._computed(lambda: self._snapshot_after(self._cells.advance, generations))
+            self.iteration += generations
+            self._exchange_timed(generations)
+            self._record_state(self.iteration, state)
+
+            if periods := self.periods_at(self.iteration):
+                if cycle := self._recorded_cycle(periods):
+                    self.follow_cycle(cycle)
+                elif not single_generations:
+                    single_generations = self._state_history
+
+        if self.iteration < iteration:
+            self._fast_forward(iteration)
+
+    def _cells_at(self, iteration: int | None) -> GolCells:
+        """The cells of the generations iterated during the last border exchange remain available,
+        the cells of the earlier iterations are restored from their recorded states.
+
+        While the cells are being iterated, the last completed generation is restored from its recorded state.
+        """
+
+        if iteration in self._cells_of_last_exchange:
+            return self._cells_of_last_exchange[iteration]
+
+        if iteration is None or iteration >= self.iteration:
+            if not self._is_iterating:
+                return self._cells
+
+            iteration = self.iteration
+
+        if self._restored_cells is None or self._restored_cells[0] != iteration:
+            self._restored_cells = iteration, type(self._cells).restore(self._state_at(iteration))
+
+        return self._restored_cells[1]
+
+    async def _send_border(self) -> None:
+        if self.halo_width == 1:
+            # The interior of the cells does not depend on the neighbors, so it is computed while waiting for them.
+            self._interior = asyncio.get_running_loop().run_in_executor(
+                None, self._timed, self._cells.iterate_interior
+            )
+
+        async with asyncio.TaskGroup() as task_group:
+            for direction, border_port in self.neighbors.items():
+                task_group.create_task(self._send_border_to(direction, border_port))
+
+    async def _send_border_to(self, direction: Direction, border_port: int) -> None:
+        """The border is taken at once, as the cells may be iterated while waiting for the connection."""
+
+        iteration, border = self.iteration, self._border_at(direction)
+
+        if (tile := self.local_tiles.get(border_port)) is not None:
+            tile.hand_over_border(
+                self.border_port, {"direction": direction.opposite.name, "iteration": iteration, "border": border}
+            )
+
+            return
+
+        await self._send_to_neighbor(
+            border_port,
+            lambda connection: connection.send_border(direction.opposite, iteration, border, self._shared_borders),
+        )
+
+    async def _send_to_neighbor(self, border_port: int, send: Callable[[Connection], Awaitable[None]]) -> None:
+        """The connection to a neighbor is opened at the first message and reused by the later ones.
+
+        It is shared by all the directions the neighbor is connected in and reopened if it has been closed.
+        """
+
+        async with self._neighbor_connection_locks[border_port]:
+            for attempt in range(2):
+                connection = self._neighbor_connections.get(border_port)
+
+                if connection is None or connection.is_closed:
+                    if connection is not None:
+                        await connection.aclose()
+
+                    connection = self._neighbor_connections[border_port] = await Connection.open(
+                        self.host, border_port
+                    )
+
+                try:
+                    await send(connection)
+
+                    return
+
+                except ConnectionError:
+                    await self._neighbor_connections.pop(border_port).aclose()
+
+                    if attempt:
+                        raise
+
+    def _border_at(self, direction: Direction) -> Any:
+        if self.halo_width == 1:
+            return self._cells.border_at(direction)
+
+        return self._cells.halo_at(direction, self.halo_width)
+
+    async def take_strip(self, direction: Direction, count: int, iteration: int) -> list[list[int]]:
+        """Removes the `count` rows or columns on the edge in the direction and returns them,
+        for the neighbor in the direction to add them by `add_strip`.
+
+        The bounds of the tiles are moved between the exchanges of the iteration, see `_moving_bounds`.
+        """
+
+        async with self._moving_bounds(iteration):
+            cells = self._cells.as_serializable
+            size = len(cells) if direction in (Direction.UP, Direction.DOWN) else len(cells[0])
+
+            if not 0 < count <= size - self.halo_width:
+                raise ValueError(
+                    f"Cannot take {count} of the {size} rows or columns of a tile of halo width {self.halo_width}"
+                )
+
+            match direction:
+                case Direction.UP:
+                    strip, cells = cells[:count], cells[count:]
+                case Direction.DOWN:
+                    strip, cells = cells[size - count:], cells[:size - count]
+                case Direction.LEFT:
+                    strip, cells = [row[:count] for row in cells], [row[count:] for row in cells]
+                case Direction.RIGHT:
+                    strip, cells = [row[size - count:] for row in cells], [row[:size - count] for row in cells]
+                case _:
+                    raise ValueError(f"Strips are taken on the sides only, not {direction.name}")
+
+            self._cells = type(self._cells)([row.copy() for row in cells])
+
+            return [row.copy() for row in strip]
+
+    async def add_strip(self, direction: Direction, strip: list[list[int]], iteration: int) -> None:
+        """Adds the rows or columns taken by the neighbor in the direction on the edge in the direction."""
+
+        async with self._moving_bounds(iteration):
+            cells = self._cells.as_serializable
+
+            match direction:
+                case Direction.UP:
+                    cells = strip + cells
+                case Direction.DOWN:
+                    cells = cells + strip
+                case Direction.LEFT:
+                    cells = [strip_row + row for strip_row, row in zip(strip, cells, strict=True)]
+                case Direction.RIGHT:
+                    cells = [row + strip_row for row, strip_row in zip(cells, strip, strict=True)]
+                case _:
+                    raise ValueError(f"Strips are added on the sides only, not {direction.name}")
+
+            self._cells = type(self._cells)([row.copy() for row in cells])
+
+    @asynccontextmanager
+    async def _moving_bounds(self, iteration: int) -> AsyncGenerator[None]:
+        """The tiles sharing the moved edge and the tiles beside them change their shapes at the same iteration,
+        before any of them has started its exchange, so all the borders of an exchange have the new shapes.
+        The measured load and the recorded states no longer apply to the new shape.
+        """
+
+        async with self._iterating():
+            if iteration != self.iteration:
+                raise RuntimeError(f"Bounds are moved at iteration {iteration}, the tile is at {self.iteration}")
+
+            if self.is_border_sent or any(border_iteration == iteration for border_iteration, _ in self.border_inbox):
+                raise RuntimeError(f"Bounds are moved while exchanging the borders of iteration {iteration}")
+
+            yield
+
+            self._cells_of_last_exchange = {}
+            self.generation_seconds.clear()
+            self._forget_cycle()
+            self._clear_states(iteration)
+
+    @staticmethod
+    def _cells_request(request: Any) -> tuple[int | None, int | None, tuple[int, int] | None]:
+        """A request is either the iteration or a dictionary of the iteration, the rows per chunk to stream
+        and optionally the start and stop of the rows to stream."""
+
+        if isinstance(request, dict):
+            return request["iteration"], request["rows_per_chunk"], request.get("rows")
+
+        return request, None, None
+
+    async def _reply_cells(
+        self,
+        connection: Connection,
+        iteration: int | None,
+        rows_per_chunk: int | None,
+        rows: tuple[int, int] | None = None,
+    ) -> None:
+        """The cells of an iteration which cannot be served any more are replied with an error."""
+
+        try:
+            if rows_per_chunk is None:
+                cells = self._cells_at(iteration)
+            else:
+                band_at = self._band_reader(iteration)
+
+        except ValueError as error:
+            await connection.send({"error": str(error)})
+
+            return
+
+        if rows_per_chunk is None:
+            await connection.send_cells(cells.as_serializable)
+
+            return
+
+        with suppress(ConnectionError):  # The client has stopped consuming the chunks.
+            start, stop = rows or (0, self._cells.shape[0])
+
+            for chunk_start in range(start, stop, rows_per_chunk):
+                await connection.send_cells(band_at(chunk_start, min(chunk_start + rows_per_chunk, stop)))
+
+            await connection.send(None)
+
+    def _band_reader(self, iteration: int | None) -> Callable[[int, int], list[list[int]]]:
+        """Reads the bands of rows of the cells at the iteration, which do not change while the tile iterates further,
+        so a slow client does not hold up the tile.
+
+        The cells of the last border exchange are never iterated again, the others are read from their recorded states.
+        """
+
+        if iteration in self._cells_of_last_exchange:
+            return self._cells_of_last_exchange[iteration].rows
+
+        iteration = self.iteration if iteration is None else min(iteration, self.iteration)
+        engine, state = type(self._cells), self._state_at(iteration)
+
+        return lambda start, stop: engine.snapshot_rows(state, start, stop)
+
+    async def _wait_for_cells(self, connection: Connection) -> None:
+        iteration, rows_per_chunk, rows = self._cells_request(await connection.recv())
+
+        async with self.has_iterated:
+            while self.iteration < iteration:
+                await self.has_iterated.wait()
+
+        await self._reply_cells(connection, iteration, rows_per_chunk, rows)
+
+    async def _send_cells(self, connection: Connection) -> None:
+        match request := await connection.recv():
+            case {"generations": generations}:
+                await connection.send(list(await self.iterate_for(generations)))
+
+                return
+
+            case {"checkpoint": path, "iteration": iteration}:
+                await self._reply(connection, self.checkpoint(path, iteration))
+
+                return
+
+            case {"wait_for_checkpoints": True}:
+                await self._reply(connection, self.wait_for_checkpoints())
+
+                return
+
+        iteration, rows_per_chunk, rows = self._cells_request(request)
+
+        if iteration:
+            await self._run_to(iteration)
+
+        await self._reply_cells(connection, iteration, rows_per_chunk, rows)
+
+    @staticmethod
+    async def _reply(connection: Connection, result: Awaitable[Any]) -> None:
+        """The errors of a request are replied instead of its result, see `RemoteTile._checked`."""
+
+        try:
+            reply = await result
+        except ValueError as error:
+            reply = {"error": str(error)}
+        except ExceptionGroup as errors:
+            reply = {"error": "; ".join(map(str, errors.exceptions))}
+
+        await connection.send(reply)
+
+    async def iterate_for(self, generations: int) -> Run:
+        """Iterates the tile and, through the border exchanges, its connected neighbors `generations` times."""
+
+        start, started = self.iteration, time.perf_counter()
+        await self._run_to(self.iteration + generations)
+
+        return Run(self.iteration - start, time.perf_counter() - started)
+
+    async def checkpoint(self, path: str, iteration: int) -> None:
+        """Iterates the tile until the iteration and writes its cells at the iteration to the file at the path,
+        see `write_checkpoint`.
+
+        Returns once the cells are copied, the file is written in the executor after the previous checkpoints
+        of the tile while the tile may iterate further, see `wait_for_checkpoints`.
+        """
+
+        await self._run_to(iteration)
+        cells = self._cells_at(iteration).as_serializable
+
+        self._checkpoint_written = asyncio.create_task(
+            self._write_checkpoint(self._checkpoint_written, path, iteration, cells)
+        )
+
+    async def wait_for_checkpoints(self) -> None:
+        """Waits until the files of the checkpoints requested so far are written.
+
+        Raises the errors of all the files which could not be written since the last call at once.
+        """
+
+        if self._checkpoint_written:
+            await asyncio.wait([self._checkpoint_written])
+
+        errors, self._checkpoint_errors = self._checkpoint_errors, []
+
+        if errors:
+            raise ExceptionGroup("The checkpoints could not be written", errors)
+
+    async def _write_checkpoint(
+        self, previous: asyncio.Task | None, path: str, iteration: int, cells: list[list[int]]
+    ) -> None:
+        if previous:
+            await asyncio.wait([previous])
+
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, write_checkpoint, path, iteration, cells)
+        except Exception as error:
+            self._checkpoint_errors.append(error)
+
+    async def _run_to(self, iteration: int) -> None:
+        """The border exchanges run on their own until the iteration, the requester is woken up only at the end."""
+
+        if self.cycle and self.iteration < iteration:
+            async with self._iterating():
+                self._fast_forward(iteration)
+
+        if not self.neighbors:
+            if self.iteration < iteration:
+                async with self._iterating():
+                    await self._advance(iteration)
+
+            return
+
+        self._run_until = max(self._run_until, iteration)
+        await self._process_border_inbox()
+
+        async with self.has_iterated:
+            await self.has_iterated.wait_for(lambda: self.iteration >= iteration)
+
+
+class RemoteTile(ABC):
+    """Client of a tile served by another process."""
+
+    host: str
+    border_port: int
+    cells_server_port: int
+    wait_for_cells_server_port: int
+
+    def connect(self, other: "RemoteTile", direction: Direction) -> None:
+        self._add_neighbor(direction, other.border_port)
+        other._add_neighbor(direction.opposite, self.border_port)
+
+    @abstractmethod
+    def _add_neighbor(self, direction: Direction, border_port: int) -> None:
+        pass
+
+    @abstractmethod
+    def _call(self, name: str, *args: Any) -> Any:
+        """Calls the method of the tile or reads its attribute in the process serving it, see `Topology.call`."""
+
+    @property
+    def seconds_per_generation(self) -> float:
+        return self._call("seconds_per_generation")
+
+    def take_strip(self, direction: Direction, count: int, iteration: int) -> list[list[int]]:
+        return self._call("take_strip", direction, count, iteration)
+
+    def add_strip(self, direction: Direction, strip: list[list[int]], iteration: int) -> None:
+        self._call("add_strip", direction, strip, iteration)
+
+    @property
+    def cycle(self) -> Cycle | None:
+        return self._call("cycle")
+
+    def periods_at(self, iteration: int) -> list[int]:
+        return self._call("periods_at", iteration)
+
+    def follow_cycle(self, cycle: Cycle) -> None:
+        self._call("follow_cycle", cycle)
+
+    async def iterate_until(self, iteration: int) -> None:
+        """Iterates the tile like requesting its cells, without sending them."""
+
+        async for _ in self.iter_cells(iteration, rows=(0, 0)):
+            pass
+
+    async def iterate_for(self, generations: int) -> Run:
+        """Iterates the tile and its connected neighbors `generations` times in one request."""
+
+        async with Connection.connect(self.host, self.cells_server_port) as connection:
+            await connection.send({"generations": generations})
+
+            return Run(*await connection.recv())
+
+    async def checkpoint(self, path: str | Path, iteration: int) -> None:
+        """Writes the cells of the tile at the iteration to a checkpoint file, see `GolTile.checkpoint`."""
+
+        async with Connection.connect(self.host, self.cells_server_port) as connection:
+            await connection.send({"checkpoint": str(Path(path).absolute()), "iteration": iteration})
+            self._checked(await connection.recv())
+
+    async def wait_for_checkpoints(self) -> None:
+        """Waits until the files of the checkpoints requested so far are written, see `GolTile.checkpoint`."""
+
+        async with Connection.connect(self.host, self.cells_server_port) as connection:
+            await connection.send({"wait_for_checkpoints": True})
+            self._checked(await connection.recv())
+
+    async def cells(self, iteration: int | None = None) -> Any:
+        return await self._request_cells(self.cells_server_port, iteration)
+
+    async def _request_cells(self, server_port: int, iteration: int | None) -> Any:
+        async with Connection.connect(self.host, server_port) as connection:
+            await connection.send(iteration)
+
+            return self._checked(await connection.recv())
+
+    async def wait_for_cells(self, iteration: int) -> Any:
+        return await self._request_cells(self.wait_for_cells_server_port, iteration)
+
+    def iter_cells(
+        self, iteration: int | None = None, rows_per_chunk: int = 1024, rows: tuple[int, int] | None = None
+    ) -> AsyncIterator[list[list[int]]]:
+        """Streams the cells in bands of rows, so neither end has to hold all the cells at once.
+
+        Only the rows from the start to the stop of `rows` are streamed if it is given.
+        """
+
+        return self._request_cell_chunks(self.cells_server_port, iteration, rows_per_chunk, rows)
+
+    def iter_wait_for_cells(
+        self, iteration: int, rows_per_chunk: int = 1024, rows: tuple[int, int] | None = None
+    ) -> AsyncIterator[list[list[int]]]:
+        return self._request_cell_chunks(self.wait_for_cells_server_port, iteration, rows_per_chunk, rows)
+
+    async def _request_cell_chunks(
+        self, server_port: int, iteration: int | None, rows_per_chunk: int, rows: tuple[int, int] | None
+    ) -> AsyncGenerator[list[list[int]]]:
+        async with Connection.connect(self.host, server_port) as connection:
+            await connection.send({"iteration": iteration, "rows_per_chunk": rows_per_chunk, "rows": rows})
+
+            while (rows := self._checked(await connection.recv())) is not None:
+                yield rows
+
+    @staticmethod
+    def _checked(reply: Any) -> Any:
+        """Raises the error the tile has replied with instead of the cells, see `GolTile._reply_cells`."""
+
+        if isinstance(reply, dict):
+            raise ValueError(reply["error"])
+
+        return reply
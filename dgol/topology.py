@@ -0,0 +1,96 @@
+import asyncio
+import inspect
+import threading
+from collections.abc import Mapping
+from multiprocessing import Pipe
+from typing import Any
+
+from dgol.cells import Direction
+
+
+class Topology:
+    """Border ports of the neighbors of the tiles of a process, registered by the parent process over a control pipe.
+
+    The tiles are identified by their border ports. Both processes keep their own copy of the neighbors,
+    which is replaced as a whole on each registration, so reading it is not an IPC round-trip
+    and a copy being iterated over is not changed by a registration.
+
+    The parent process also calls the methods of the tiles over the pipe, e.g. to move their bounds.
+    The calls block until the reply, they may be made from several threads of the parent process.
+    """
+
+    def __init__(self):
+        self.neighbors: dict[int, dict[Direction, int]] = {}
+        self._parent_end, self._child_end = Pipe()
+        self._calls: set[asyncio.Task] = set()
+        self._parent_end_lock = threading.Lock()
+
+    def started(self) -> None:
+        """Called by the parent process after starting the child process, which uses the child end only."""
+
+        self._child_end.close()
+
+    def neighbors_of(self, border_port: int) -> dict[Direction, int]:
+        return self.neighbors.get(border_port, {})
+
+    def add_neighbor(self, border_port: int, direction: Direction, neighbor_border_port: int) -> None:
+        """Returns when the child process has registered the neighbor."""
+
+        with self._parent_end_lock:
+            self._parent_end.send(("register", border_port, direction, neighbor_border_port))
+            self._parent_end.recv()
+
+        self._register(border_port, direction, neighbor_border_port)
+
+    def call(self, border_port: int, name: str, *args: Any) -> Any:
+        """Returns the result of the method of the tile, awaited by the child process if it is a coroutine,
+        or the value of the attribute of the tile if it is not callable.
+
+        The exception raised by the method is raised again in the parent process.
+        """
+
+        with self._parent_end_lock:
+            self._parent_end.send(("call", border_port, name, args))
+            result, error = self._parent_end.recv()
+
+        if error is not None:
+            raise error
+
+        return result
+
+    def receive_commands(self, loop: asyncio.AbstractEventLoop, tiles: Mapping[int, Any]) -> None:
+        """The commands are received by the event loop of the child process, the tiles are keyed by border port."""
+
+        loop.add_reader(self._child_end.fileno(), self._receive_command, tiles)
+
+    def _receive_command(self, tiles: Mapping[int, Any]) -> None:
+        match self._child_end.recv():
+            case ("register", *registration):
+                self._register(*registration)
+                self._child_end.send(True)
+
+            case ("call", border_port, name, args):
+                try:
+                    attribute = getattr(tiles[border_port], name)
+                    result = attribute(*args) if callable(attribute) else attribute
+                except Exception as error:
+                    self._child_end.send((None, error))
+
+                    return
+
+                if inspect.isawaitable(result):
+                    call = asyncio.ensure_future(result)
+                    self._calls.add(call)
+                    call.add_done_callback(self._reply)
+                else:
+                    self._child_end.send((result, None))
+
+    def _reply(self, call: asyncio.Future) -> None:
+        self._calls.discard(call)
+
+        if not call.cancelled():
+            self._child_end.send((call.result(), None) if call.exception() is None else (None, call.exception()))
+
+    def _register(self, border_port: int, direction: Direction, neighbor_border_port: int) -> None:
+        neighbors = {**self.neighbors_of(border_port), direction: neighbor_border_port}
+        self.neighbors = {**self.neighbors, border_port: neighbors}
@@ -0,0 +1,376 @@
+import asyncio
+import itertools
+import math
+import os
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, Self, TypeVar
+
+from dgol.cells import Direction
+from dgol.checkpoint import read_checkpoint
+from dgol.patterns import format_plaintext, read_pattern
+from dgol.tile import Cycle
+from dgol.worker import GolWorker, WorkerTile
+
+T = TypeVar("T")
+
+# Each pair of neighbors is connected once, from the tile having the other one in these directions.
+CONNECTED_DIRECTIONS = {
+    Direction.UP: (-1, 0),
+    Direction.UPRIGHT: (-1, 1),
+    Direction.RIGHT: (0, 1),
+    Direction.DOWNRIGHT: (1, 1),
+}
+
+
+def split(length: int, parts: int) -> list[int]:
+    """Boundaries of `parts` balanced ranges of `length`, their lengths differ by at most one."""
+
+    return [part * length // parts for part in range(parts + 1)]
+
+
+class Universe:
+    """Universe split into a grid of tiles, which are served by worker processes and connected in all directions.
+
+    The tiles are at most `tile_shape` big, by default the universe is split into as many tiles as workers.
+    With `wrap`, the tiles on the edges are connected to the tiles on the opposite edges, making the universe toroidal.
+    The other arguments are passed to the workers.
+    """
+
+    def __init__(
+        self,
+        cells: list[list[int]],
+        tile_shape: tuple[int, int] | None = None,
+        workers: int | None = None,
+        wrap: bool = False,
+        **kwargs: Any,
+    ):
+        rows, columns = len(cells), len(cells[0])
+        workers = workers or os.cpu_count() or 1
+        grid_rows, grid_columns = (
+            (math.ceil(rows / tile_shape[0]), math.ceil(columns / tile_shape[1])) if tile_shape else
+            self._grid_of(workers, rows, columns)
+        )
+
+        self.shape = rows, columns
+        self.wrap = wrap
+        self.halo_width = kwargs.get("halo_width", 1)
+        self.row_bounds = split(rows, grid_rows)
+        self.column_bounds = split(columns, grid_columns)
+
+        sizes = [
+            stop - start for bounds in (self.row_bounds, self.column_bounds) for start, stop in zip(bounds, bounds[1:])
+        ]
+
+        if min(sizes) < self.halo_width:
+            raise ValueError(f"Tiles of {min(sizes)} rows or columns are smaller than the halo width {self.halo_width}")
+
+        self._start_tiles(
+            [
+                [
+                    [row[left:right] for row in cells[top:bottom]]
+                    for left, right in zip(self.column_bounds, self.column_bounds[1:])
+                ]
+                for top, bottom in zip(self.row_bounds, self.row_bounds[1:])
+            ],
+            workers,
+            **kwargs,
+        )
+
+    @classmethod
+    def from_file(cls, path: str | Path, **kwargs: Any) -> Self:
+        return cls(read_pattern(path), **kwargs)
+
+    @classmethod
+    def from_checkpoint(
+        cls, directory: str | Path, workers: int | None = None, wrap: bool = False, **kwargs: Any
+    ) -> Self:
+        """Starts the universe from the checkpoints of its tiles written by `checkpoint`, with the same bounds.
+
+        All the tiles must have been checkpointed at the same iteration.
+        """
+
+        checkpoints = {
+            tuple(map(int, path.stem.split("-")[1:])): read_checkpoint(path)
+            for path in Path(directory).glob("tile-*-*.gol")
+        }
+        iterations = {iteration for iteration, _ in checkpoints.values()}
+        grid_rows = 1 + max((row for row, _ in checkpoints), default=-1)
+        grid_columns = 1 + max((column for _, column in checkpoints), default=-1)
+
+        if len(iterations) != 1 or len(checkpoints) != grid_rows * grid_columns:
+            raise ValueError(f"{directory} does not hold the checkpoints of all the tiles at the same iteration")
+
+        tiles = [[checkpoints[row, column][1] for column in range(grid_columns)] for row in range(grid_rows)]
+        universe = cls.__new__(cls)
+        universe.wrap = wrap
+        universe.halo_width = kwargs.get("halo_width", 1)
+        universe.row_bounds = [0, *itertools.accumulate(len(tile_row[0]) for tile_row in tiles)]
+        universe.column_bounds = [0, *itertools.accumulate(len(tile[0]) for tile in tiles[0])]
+        universe.shape = universe.row_bounds[-1], universe.column_bounds[-1]
+        universe._start_tiles(tiles, workers or os.cpu_count() or 1, iteration=iterations.pop(), **kwargs)
+
+        return universe
+
+    def _start_tiles(self, tiles: list[list[list[list[int]]]], workers: int, **kwargs: Any) -> None:
+        grid_columns = len(tiles[0])
+        started_tiles = GolWorker.start_pool([tile for tile_row in tiles for tile in tile_row], workers, **kwargs)
+        self.tiles: list[list[WorkerTile]] = [
+            started_tiles[row * grid_columns:(row + 1) * grid_columns] for row in range(len(tiles))
+        ]
+
+        self._connect_tiles()
+
+    @staticmethod
+    def _grid_of(tiles: int, rows: int, columns: int) -> tuple[int, int]:
+        """The grid of at most `tiles` tiles having the most square tiles."""
+
+        grids = [
+            (grid_rows, grid_columns)
+            for grid_rows in range(1, min(tiles, rows) + 1)
+            if (grid_columns := min(tiles // grid_rows, columns))
+        ]
+
+        return min(grids, key=lambda grid: (-grid[0] * grid[1], abs(math.log(rows / grid[0] * grid[1] / columns))))
+
+    def _connect_tiles(self) -> None:
+        grid_rows, grid_columns = len(self.tiles), len(self.tiles[0])
+
+        for row, tile_row in enumerate(self.tiles):
+            for column, tile in enumerate(tile_row):
+                for direction, (row_offset, column_offset) in CONNECTED_DIRECTIONS.items():
+                    neighbor_row, neighbor_column = row + row_offset, column + column_offset
+
+                    if self.wrap:
+                        neighbor_row, neighbor_column = neighbor_row % grid_rows, neighbor_column % grid_columns
+                    elif not (0 <= neighbor_row < grid_rows and 0 <= neighbor_column < grid_columns):
+                        continue
+
+                    tile.connect(self.tiles[neighbor_row][neighbor_column], direction)
+
+    async def gather(
+        self,
+        iteration: int | None = None,
+        region: tuple[int, int, int, int] | None = None,
+        out: Any = None,
+        parallelism: int = 8,
+        rows_per_chunk: int = 1024,
+    ) -> Any:
+        """Cells of the universe or of the `region` given by its top, left, bottom and right bounds at the iteration.
+
+        Only the tiles intersecting the region are contacted, at most `parallelism` of them at once.
+        Their cells are streamed in bands of rows straight into `out`, a preallocated grid supporting slice assignment
+        of its rows, e.g. a NumPy array. A list of lists is allocated if `out` is not given.
+        """
+
+        top, left, bottom, right = region or (0, 0, *self.shape)
+
+        if out is None:
+            out = [[0] * (right - left) for _ in range(bottom - top)]
+
+        semaphore = asyncio.Semaphore(parallelism)
+
+        async def gather_tile(tile: WorkerTile, tile_top: int, tile_left: int, rows: range, columns: range) -> None:
+            async with semaphore:
+                row = rows.start
+                cropped = slice(columns.start - tile_left, columns.stop - tile_left)
+                placed = slice(columns.start - left, columns.stop - left)
+
+                async for band in tile.iter_cells(
+                    iteration, rows_per_chunk, (rows.start - tile_top, rows.stop - tile_top)
+                ):
+                    for cells in band:
+                        out[row - top][placed] = cells[cropped]
+                        row += 1
+
+        async with asyncio.TaskGroup() as tasks:
+            for intersection in self._tiles_within(top, left, bottom, right):
+                tasks.create_task(gather_tile(*intersection))
+
+        return out
+
+    async def gather_to_file(
+        self,
+        path: str | Path,
+        iteration: int | None = None,
+        region: tuple[int, int, int, int] | None = None,
+        parallelism: int = 8,
+    ) -> None:
+        """Writes the cells in the plaintext format, one row of tiles at a time, so the whole universe is never held."""
+
+        top, left, bottom, right = region or (0, 0, *self.shape)
+
+        with open(path, "w") as file:
+            for band_top, band_bottom in zip(self.row_bounds, self.row_bounds[1:]):
+                if (band_top := max(band_top, top)) < (band_bottom := min(band_bottom, bottom)):
+                    band = await self.gather(iteration, (band_top, left, band_bottom, right), parallelism=parallelism)
+                    file.write(format_plaintext(band))
+
+    async def checkpoint(self, directory: str | Path, iteration: int) -> None:
+        """Iterates the universe until the iteration and writes the cells of each tile at the iteration
+        to its own file in the directory, which `from_checkpoint` starts the universe from.
+
+        Returns once the tiles have copied their cells, the files are written in the background
+        while the universe keeps iterating, see `wait_for_checkpoints`.
+        A checkpoint replaces the previous one tile by tile.
+        """
+
+        Path(directory).mkdir(parents=True, exist_ok=True)
+
+        async with asyncio.TaskGroup() as tasks:
+            for row, tile_row in enumerate(self.tiles):
+                for column, tile in enumerate(tile_row):
+                    tasks.create_task(tile.checkpoint(Path(directory) / f"tile-{row}-{column}.gol", iteration))
+
+    async def wait_for_checkpoints(self) -> None:
+        """Waits until the files of all the checkpoints requested so far are written."""
+
+        async with asyncio.TaskGroup() as tasks:
+            for tile_row in self.tiles:
+                for tile in tile_row:
+                    tasks.create_task(tile.wait_for_checkpoints())
+
+    async def rebalance(self, iteration: int, tolerance: float = 0.25) -> bool:
+        """Iterates the universe until the iteration and moves the bounds of the tiles toward the busiest tiles.
+
+        The load of a row or column of tiles is the time its slowest tile spends computing a generation,
+        as the others wait for it. The bound between the adjacent rows of tiles and the one between the adjacent columns
+        of tiles whose loads differ the most, by more than `tolerance`, are moved, so the busy tiles hand over rows
+        or columns to their less loaded neighbors. Whole rows or columns of tiles are resized to keep the grid aligned.
+        Empty regions are cheap for the sparse engines, so the bounds of their tiles move toward empty space.
+
+        The universe must not be iterated beyond the iteration meanwhile. With halos, the borders have to be exchanged
+        at the iteration. Returns whether any bound has been moved.
+        """
+
+        async with asyncio.TaskGroup() as tasks:
+            for tile_row in self.tiles:
+                for tile in tile_row:
+                    tasks.create_task(tile.iterate_until(iteration))
+
+        loads = [
+            [await self._control(lambda tile=tile: tile.seconds_per_generation) for tile in tile_row]
+            for tile_row in self.tiles
+        ]
+        moved_rows = await self._move_bound(
+            self.row_bounds,
+            [max(tile_loads) for tile_loads in loads],
+            lambda band: list(zip(self.tiles[band], self.tiles[band + 1])),
+            Direction.DOWN,
+            iteration,
+            tolerance,
+            self.halo_width,
+        )
+        moved_columns = await self._move_bound(
+            self.column_bounds,
+            [max(tile_loads) for tile_loads in zip(*loads)],
+            lambda band: [(tile_row[band], tile_row[band + 1]) for tile_row in self.tiles],
+            Direction.RIGHT,
+            iteration,
+            tolerance,
+            self.halo_width,
+        )
+
+        return moved_rows or moved_columns
+
+    async def detect_cycle(self, iteration: int) -> Cycle | None:
+        """Iterates the universe until the iteration and looks for the shortest period all the tiles repeat with.
+
+        The universe is then in a cycle, which the tiles follow: the later iterations are answered with their recorded
+        states instead of being iterated. Cycles up to the number of states recorded by the tiles are detected.
+        """
+
+        async with asyncio.TaskGroup() as tasks:
+            for tile_row in self.tiles:
+                for tile in tile_row:
+                    tasks.create_task(tile.iterate_until(iteration))
+
+        tiles = [tile for tile_row in self.tiles for tile in tile_row]
+        periods = set.intersection(*[set(await self._control(tile.periods_at, iteration)) for tile in tiles])
+
+        if not periods:
+            return None
+
+        cycle = Cycle(iteration - min(periods), min(periods))
+
+        for tile in tiles:
+            await self._control(tile.follow_cycle, cycle)
+
+        return cycle
+
+    @staticmethod
+    async def _control(call: Callable[..., T], *args: Any) -> T:
+        """The control calls of the tiles block on the pipes of the workers, so they are made in the executor,
+        while the event loop keeps serving e.g. the streams of `gather`, which the tiles may wait for.
+        """
+
+        return await asyncio.get_running_loop().run_in_executor(None, call, *args)
+
+    @classmethod
+    async def _move_bound(
+        cls,
+        bounds: list[int],
+        loads: list[float],
+        tiles_beside: Callable[[int], list[tuple[WorkerTile, WorkerTile]]],
+        direction: Direction,
+        iteration: int,
+        tolerance: float,
+        halo_width: int,
+    ) -> bool:
+        """Moves the bound after the band of tiles, which is in the direction of the band before it,
+        by as many rows or columns as the measured loads per row or column make both bands equally loaded.
+        The busy band keeps at least `halo_width` rows or columns.
+        """
+
+        imbalances = {
+            band: max(loads[band], loads[band + 1]) / min(loads[band], loads[band + 1]) - 1
+            for band in range(len(loads) - 1)
+            if min(loads[band], loads[band + 1]) > 0
+        }
+
+        if not imbalances:
+            return False
+
+        band = max(imbalances, key=imbalances.__getitem__)
+        busy, idle = (band, band + 1) if loads[band] > loads[band + 1] else (band + 1, band)
+        size = bounds[busy + 1] - bounds[busy]
+
+        if imbalances[band] <= tolerance or size <= halo_width:
+            return False
+
+        count = min(size - halo_width, max(1, round((loads[busy] - loads[idle]) / (2 * loads[busy] / size))))
+
+        for before, after in tiles_beside(band):
+            giving, receiving = (before, after) if busy == band else (after, before)
+            edge = direction if busy == band else direction.opposite
+            strip = await cls._control(giving.take_strip, edge, count, iteration)
+            await cls._control(receiving.add_strip, edge.opposite, strip, iteration)
+
+        bounds[band + 1] += -count if busy == band else count
+
+        return True
+
+    def _tiles_within(
+        self, top: int, left: int, bottom: int, right: int
+    ) -> Iterator[tuple[WorkerTile, int, int, range, range]]:
+        """The tiles intersecting the region with their top left corners and the rows and columns within the region."""
+
+        for tile_row, (tile_top, tile_bottom) in zip(self.tiles, zip(self.row_bounds, self.row_bounds[1:])):
+            if (rows := range(max(top, tile_top), min(bottom, tile_bottom))):
+                for tile, (tile_left, tile_right) in zip(tile_row, zip(self.column_bounds, self.column_bounds[1:])):
+                    if (columns := range(max(left, tile_left), min(right, tile_right))):
+                        yield tile, tile_top, tile_left, rows, columns
+
+    @property
+    def workers(self) -> list[GolWorker]:
+        return list(dict.fromkeys(tile.worker for tile_row in self.tiles for tile in tile_row))
+
+    def terminate(self) -> None:
+        for worker in self.workers:
+            worker.terminate()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.terminate()
@@ -0,0 +1,160 @@
+import asyncio
+import os
+import signal
+from contextlib import suppress
+from multiprocessing import Array, Event, Process, resource_tracker
+from typing import Any, cast
+
+from dgol.cells import Direction, GolCells
+from dgol.tile import HISTORY_BYTES, STATE_HISTORY, GolTile, RemoteTile, shared_borders_slot_size
+from dgol.topology import Topology
+
+
+class GolWorker(Process):
+    """Process serving many tiles in a single event loop.
+
+    The borders between its own tiles are handed over in memory, only the borders to the tiles
+    of other processes are sent on connections. The tiles are accessed through `tiles`.
+    """
+
+    def __init__(
+        self,
+        tiles: list[list[list[int]]],
+        engine: type[GolCells] | None = None,
+        halo_width: int = 1,
+        shared_memory: bool = True,
+        look_ahead: int = 1,
+        history_bytes: int = HISTORY_BYTES,
+        state_history: int = STATE_HISTORY,
+        iteration: int = 0,
+        wait: bool = True,
+    ):
+        """With a `halo_width` greater than 1, the neighbors exchange that deep borders
+        and iterate as many generations between the exchanges.
+
+        With `shared_memory`, the borders are published in shared memory if the neighbors are on the same host.
+
+        The borders of up to `look_ahead` exchanges ahead are buffered, so the neighbors can run ahead of the tiles.
+        Receiving the borders of a neighbor further ahead is blocked until the tile catches up.
+
+        The cells of the last `state_history` iterations are kept within `history_bytes` and served exactly,
+        see `GolTile`.
+
+        The cells are those of the `iteration`, e.g. restored by `GolProcess.from_checkpoint`.
+
+        Without `wait`, `wait_until_started` has to be called before accessing the tiles,
+        so many workers can be started in parallel.
+        """
+
+        if not tiles:
+            raise ValueError("A worker serves at least one tile")
+
+        super().__init__()
+
+        self.host = "127.0.0.1"
+        self._ports = Array("i", 3 * len(tiles))
+        self._topology = Topology()
+
+        local_tiles: dict[int, GolTile] = {}
+        self._tiles = [
+            GolTile(
+                (engine or GolCells)(cells),
+                self._topology,
+                self.host,
+                halo_width,
+                look_ahead,
+                shared_borders_slot_size(cells, halo_width) if shared_memory else None,
+                local_tiles,
+                history_bytes,
+                state_history,
+                iteration,
+            )
+            for cells in tiles
+        ]
+        self.tiles_started = Event()
+
+        # The processes share the tracker of the shared memory segments, otherwise the tracker of a neighbor
+        # would unlink the segments the neighbor has read when the neighbor exits.
+        resource_tracker.ensure_running()
+        self.start()
+        self._topology.started()
+
+        if wait:
+            self.wait_until_started()
+
+    def wait_until_started(self) -> None:
+        self.tiles_started.wait()
+
+        self.tiles = [WorkerTile(self, *self._ports[index * 3:index * 3 + 3]) for index in range(len(self._tiles))]
+
+    @classmethod
+    def start_pool(cls, tiles: list[list[list[int]]], workers: int | None = None, **kwargs) -> list["WorkerTile"]:
+        """Distributes the tiles among `workers` processes, as many as the CPU cores by default.
+
+        Consecutive tiles are served by the same process, the tiles are returned in the given order.
+        The workers are started in parallel.
+        """
+
+        workers = max(1, min(workers or os.cpu_count() or 1, len(tiles)))
+        tiles_per_worker = -(-len(tiles) // workers)
+        started_workers = [
+            cls(tiles[start:start + tiles_per_worker], wait=False, **kwargs)
+            for start in range(0, len(tiles), tiles_per_worker)
+        ]
+
+        for worker in started_workers:
+            worker.wait_until_started()
+
+        return [tile for worker in started_workers for tile in worker.tiles]
+
+    def _add_neighbor_of(self, border_port: int, direction: Direction, neighbor_border_port: int) -> None:
+        self._topology.add_neighbor(border_port, direction, neighbor_border_port)
+
+    def neighbors_of(self, border_port: int) -> dict[Direction, int]:
+        return self._topology.neighbors_of(border_port)
+
+    def _call_tile(self, border_port: int, name: str, *args: Any) -> Any:
+        return self._topology.call(border_port, name, *args)
+
+    def run(self) -> None:
+        with suppress(asyncio.CancelledError):  # Terminated.
+            asyncio.run(self.arun())
+
+    async def arun(self) -> None:
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(signal.SIGTERM, cast(asyncio.Task, asyncio.current_task()).cancel)
+        self._topology.receive_commands(loop, self._tiles[0].local_tiles)
+
+        async with asyncio.TaskGroup() as task_group:
+            for index, tile in enumerate(self._tiles):
+                task_group.create_task(tile.serve(lambda index=index, tile=tile: self._started(index, tile)))
+
+    def _started(self, index: int, tile: GolTile) -> None:
+        tile.local_tiles[tile.border_port] = tile
+        self._ports[index * 3:index * 3 + 3] = [
+            tile.border_port, tile.cells_server_port, tile.wait_for_cells_server_port
+        ]
+
+        if len(tile.local_tiles) == len(self._tiles):
+            self.tiles_started.set()
+
+
+class WorkerTile(RemoteTile):
+    """Tile served by a `GolWorker`."""
+
+    def __init__(self, worker: GolWorker, border_port: int, cells_server_port: int, wait_for_cells_server_port: int):
+        self.worker = worker
+        self.host = worker.host
+        self.border_port = border_port
+        self.cells_server_port = cells_server_port
+        self.wait_for_cells_server_port = wait_for_cells_server_port
+
+    def _add_neighbor(self, direction: Direction, border_port: int) -> None:
+        self.worker._add_neighbor_of(self.border_port, direction, border_port)
+
+    def _call(self, name: str, *args: Any) -> Any:
+        return self.worker._call_tile(self.border_port, name, *args)
+
+    @property
+    def neighbors(self) -> dict[Direction, int]:
+        return self.worker.neighbors_of(self.border_port)